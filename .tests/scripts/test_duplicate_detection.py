@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Regression test for name-collision handling in get_unique_target_path
+
+TorrentZip'd sets stamp every file with the same fixed mtime, so a source and an
+existing target can share size and mtime while holding different ROMs. Those must
+be renamed, never skipped as identical - with a cold hash cache and with a warm one
+that already holds the target's digest (the re-run of an organised library).
+
+Run from the project root:
+    python .tests/scripts/test_duplicate_detection.py
+"""
+
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import dat_to_shortcode_converter as converter
+from dat_to_shortcode_converter import get_unique_target_path, open_hash_cache, file_sha1
+
+FIXED_MTIME_NS = 1_000_000_000 * 1_000_000_000  # Same stamp on every file, as TorrentZip does
+
+def write_rom(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    os.utime(path, ns=(FIXED_MTIME_NS, FIXED_MTIME_NS))
+    return path
+
+def check_collision(root: Path, label: str, source_data: bytes, target_data: bytes,
+                    warm_cache: bool = False) -> str:
+    """Place target_data in NES/ and resolve a same-named source holding source_data
+    
+    warm_cache opens a hash cache in a temp DB and hashes the target first, as an
+    earlier run over the same library would have.
+    """
+    case_dir = root / label
+    target_dir = case_dir / "target"
+    target_path = write_rom(target_dir / "NES" / "Zelda.nes", target_data)
+    source_path = write_rom(case_dir / "source" / "Nintendo - NES (Europe)" / "Zelda.nes", source_data)
+    
+    cache = None
+    if warm_cache:
+        cache = open_hash_cache(case_dir / "hash_cache.sqlite")
+        file_sha1(target_path)
+        cache.flush()
+    
+    claimed = {os.path.normcase("Zelda.nes")}
+    trusted = frozenset(claimed)
+    try:
+        _, reason = get_unique_target_path(source_path, target_dir, "NES", source_path.parent.name,
+                                           claimed, logging.getLogger("test_duplicate_detection"),
+                                           trusted_names=trusted)
+    finally:
+        if cache is not None:
+            cache.close()
+            converter._hash_cache = None
+    return reason
+
+def main():
+    print("🧪 Duplicate Detection Test")
+    print("=" * 60)
+    
+    size = 1024 * 1024
+    unsampled_offset = 200_000  # Outside the head, middle and tail sample blocks
+    patched = bytearray(b"A" * size)
+    patched[unsampled_offset] = ord("B")
+    
+    test_cases = [
+        ("different_small", b"B" * 40960, b"A" * 40960, False, False),
+        ("different_unsampled", bytes(patched), b"A" * size, False, False),
+        ("identical", b"A" * size, b"A" * size, False, True),
+        ("different_small_warm_cache", b"B" * 40960, b"A" * 40960, True, False),
+        ("different_unsampled_warm_cache", bytes(patched), b"A" * size, True, False),
+        ("identical_warm_cache", b"A" * size, b"A" * size, True, True),
+    ]
+    
+    passed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, source_data, target_data, warm_cache, expect_skip in test_cases:
+            reason = check_collision(Path(tmp), label, source_data, target_data, warm_cache)
+            skipped = bool(reason) and reason.startswith("skip_identical")
+            ok = skipped == expect_skip
+            passed += ok
+            status = "✅ PASS" if ok else "❌ FAIL"
+            print(f"{status} {label}: reason={reason!r} (expected {'skip' if expect_skip else 'rename'})")
+    
+    print("=" * 60)
+    print(f"📊 Results: {passed}/{len(test_cases)} tests passed")
+    return passed == len(test_cases)
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -19,13 +19,21 @@ import io
 import locale
 import os
 
+# Force UTF-8 for console output: one encoding decision at startup instead of per-character
+# fallbacks (or UnicodeEncodeError on emoji) when the console defaults to cp1252/ASCII
+for _stream_name in ('stdout', 'stderr'):
+    _stream = getattr(sys, _stream_name)
+    if sys.platform != 'win32' and (getattr(_stream, 'encoding', None) or '').lower().replace('-', '') == 'utf8':
+        continue
+    if hasattr(_stream, 'reconfigure'):
+        # Reconfigure in place (Python 3.7+) rather than stacking a second wrapper on the same buffer
+        _stream.reconfigure(encoding='utf-8', errors='replace', line_buffering=True)
+    elif hasattr(_stream, 'buffer'):
+        setattr(sys, _stream_name, io.TextIOWrapper(_stream.buffer, encoding='utf-8', errors='replace', line_buffering=True))
+
 # Force UTF-8 for all I/O operations on Windows
 if sys.platform == 'win32':
     # Windows-specific encoding fixes
-    if hasattr(sys.stdout, 'buffer'):
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
-    if hasattr(sys.stderr, 'buffer'):
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
     os.environ['PYTHONIOENCODING'] = 'utf-8:replace'
     
     # Try to set console code page to UTF-8 (may fail in some environments)
@@ -51,9 +59,10 @@ import os
 import sys
 import hashlib
 import shutil
+import errno
 import argparse
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
 import re
 import mmap
 import threading
@@ -64,16 +73,20 @@ import uuid
 import atexit
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Set, Optional, NamedTuple
+from typing import Dict, List, Tuple, Set, Optional
 from collections import defaultdict, Counter
 from dataclasses import dataclass, field
 import json
+import sqlite3
+import statistics
+import itertools
 from good_pattern_handler import SpecializedPatternProcessor
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import queue
 from threading import Lock, Event
 from subcategory_handler import SubcategoryProcessor
 from functools import wraps
+from contextlib import nullcontext
 from collections import defaultdict
 
 
@@ -188,10 +201,14 @@ class GracefulShutdownHandler:
 
 
 class SafeFileHandler(logging.FileHandler):
-    """File handler that sanitizes output for safe logging"""
+    """File handler that sanitizes output for safe logging
+    
+    flush_each_record=False leaves flushing to the caller (see BufferedLogHandler).
+    """
     
-    def __init__(self, filename, mode='a', encoding='utf-8', delay=False):
+    def __init__(self, filename, mode='a', encoding='utf-8', delay=False, flush_each_record=True):
         super().__init__(filename, mode, encoding, delay)
+        self.flush_each_record = flush_each_record
     
     def emit(self, record):
         """Emit a record with sanitized message"""
@@ -202,11 +219,116 @@ class SafeFileHandler(logging.FileHandler):
             # Remove emojis and other high Unicode characters for log files
             msg = ''.join(c if ord(c) < 128 else '?' for c in msg)
             self.stream.write(msg + self.terminator)
-            self.flush()
+            if self.flush_each_record:
+                self.flush()
         except Exception:
             self.handleError(record)
 
 
+class BufferedLogHandler(MemoryHandler):
+    """MemoryHandler that hands records to its file handler in batches and flushes the file once per batch
+    
+    Batches go out when the buffer fills, on any ERROR record, once flush_interval
+    seconds have passed since the last batch, and at logging shutdown. The interval
+    bounds how far the log files lag behind the run (and how much a killed process
+    loses); QueuedLogHandler's listener also flushes when the queue goes idle.
+    """
+    
+    def __init__(self, target: logging.Handler, capacity: int = 1024, flush_interval: float = 1.0):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+    
+    def shouldFlush(self, record):
+        return (super().shouldFlush(record)
+                or time.monotonic() - self._last_flush >= self.flush_interval)
+    
+    def flush(self):
+        self.acquire()
+        try:
+            super().flush()
+            if self.target:
+                self.target.flush()
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+
+class _IdleFlushQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue has been empty for flush_interval seconds
+    
+    An Event put on the queue is a flush request: everything queued before it is
+    handled, the handlers are flushed, and the Event is set.
+    """
+    
+    def __init__(self, queue, *handlers, respect_handler_level=False, flush_interval: float = 1.0):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+    
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                # Nothing logged lately: write out whatever is still buffered
+                for handler in self.handlers:
+                    handler.flush()
+    
+    def handle(self, record):
+        if isinstance(record, Event):
+            for handler in self.handlers:
+                handler.flush()
+            record.set()
+            return
+        super().handle(record)
+
+
+class QueuedLogHandler(QueueHandler):
+    """QueueHandler whose file writes happen on a QueueListener thread
+    
+    Logging threads only format the message and enqueue the record; the listener
+    hands records to the wrapped handler (a BufferedLogHandler), so file I/O and its
+    lock stay off the copy workers. flush() blocks until the queue has been written,
+    without holding the handler lock, so other threads keep logging meanwhile.
+    """
+    
+    def __init__(self, target: logging.Handler):
+        super().__init__(queue.SimpleQueue())
+        self.target = target
+        self.listener = _IdleFlushQueueListener(self.queue, target, respect_handler_level=True)
+        self.listener.start()
+        self._listening = True
+    
+    def flush(self):
+        if self._listening and threading.current_thread() is not self.listener._thread:
+            # Records queued before the marker are written before the listener sets it
+            drained = Event()
+            self.queue.put_nowait(drained)
+            while not drained.wait(0.1):
+                if not self._listening:
+                    break  # close() stopped the listener; it drained the queue up to its sentinel
+        self.target.flush()
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self._listening:
+                self.listener.stop()
+                self._listening = False
+        finally:
+            self.release()
+        super().close()
+
+
+def log_file_handler(handler: logging.Handler) -> logging.Handler:
+    """Innermost handler behind QueuedLogHandler/BufferedLogHandler wrappers"""
+    while getattr(handler, 'target', None) is not None:
+        handler = handler.target
+    return handler
+
+
 class PerformanceMonitor:
     """
     Performance monitoring for pattern matching operations
@@ -323,13 +445,14 @@ class PerformanceMonitor:
                 self.logger.info(f"  {cache_type}: {data['hit_rate']:.1f}% hit rate ({data['hits']}/{data['hits'] + data['misses']})")
 
 
-class PlatformInfo(NamedTuple):
-    """Information about a detected platform"""
+@dataclass
+class PlatformInfo:
+    """Information about a detected platform (updated in place while analyzing)"""
     shortcode: str
     display_name: str
-    folder_count: int
-    file_count: int
-    source_folders: List[str]
+    folder_count: int = 0
+    file_count: int = 0
+    source_folders: List[str] = field(default_factory=list)
 
 @dataclass
 class ProcessingStats:
@@ -355,6 +478,18 @@ class ProcessingStats:
     def total_unique_files(self) -> int:
         """Calculate total unique files processed (copied + renamed)"""
         return self.files_copied + self.files_renamed_duplicates
+    
+    def merge(self, other: 'ProcessingStats') -> None:
+        """Fold another shard's copy statistics into this one"""
+        self.files_found += other.files_found
+        self.files_copied += other.files_copied
+        self.files_replaced += other.files_replaced
+        self.files_renamed_duplicates += other.files_renamed_duplicates
+        self.files_skipped_duplicate += other.files_skipped_duplicate
+        self.files_skipped_unknown += other.files_skipped_unknown
+        self.errors += other.errors
+        self.error_details.extend(other.error_details)
+        self.folders_created |= other.folders_created
 
 # Enhanced platform mappings with regex patterns
 PLATFORM_MAPPINGS = {
@@ -607,8 +742,21 @@ EXCLUDED_PLATFORMS = {
     r"Unofficial.*Obscure Gamers.*": "Homebrew collection not standard platform",
 }
 
-# ROM file extensions for detection
-ROM_EXTENSIONS = {
+# OS/VCS metadata folders that are never platforms (compared lowercased); hidden dot-folders are rejected too
+NON_PLATFORM_FOLDERS = frozenset({
+    'system volume information', '$recycle.bin', 'recycler', 'lost+found',
+    '.git', '.svn', '__macosx', '@eadir', '.trashes', '.spotlight-v100', '.fseventsd',
+})
+
+# All exclusion patterns as one alternation; the matching group's index selects the reason
+_EXCLUSION_REASONS = list(EXCLUDED_PLATFORMS.values())
+_EXCLUSION_MATCHER = re.compile(
+    '|'.join(f'(?P<e{index}>{pattern})' for index, pattern in enumerate(EXCLUDED_PLATFORMS)),
+    re.IGNORECASE
+)
+
+# ROM file extensions for detection (lowercase; callers lowercase the suffix once before lookup)
+ROM_EXTENSIONS = frozenset({
     # Nintendo Systems
     '.nes', '.fds', '.nsf', '.unf', '.nez',  # NES/Famicom
     '.sfc', '.smc', '.swc', '.fig', '.bsx', '.st',  # SNES + Satellaview/Sufami Turbo
@@ -652,13 +800,111 @@ ROM_EXTENSIONS = {
     '.cue', '.chd', '.mds', '.ccd', '.sub', '.img',  # Disc images
     '.m3u', '.mdf', '.nrg',  # Playlists and disc images
     
-    # Compressed Formats
-    '.zip', '.7z', '.rar', '.tar.gz', '.gz', '.bz2',  # Compressed archives
-}
+    # Compressed Formats (.tar.gz archives match through '.gz': extensions are the last suffix only)
+    '.zip', '.7z', '.rar', '.gz', '.bz2',  # Compressed archives
+})
+# Lookups use a lowercased suffix (file_extension), so a mixed-case entry here could never match
+assert all(extension == extension.lower() for extension in ROM_EXTENSIONS), "ROM_EXTENSIONS must be lowercase"
+# Same extensions for str.endswith(), which tests the whole tuple in one C call
+ROM_EXTENSION_SUFFIXES = tuple(sorted(ROM_EXTENSIONS))
 
 class RegionalPreferenceEngine:
     """Handles regional consolidation vs separation logic"""
     
+    # Display names, built once at class creation rather than on every lookup
+    DISPLAY_NAMES = {
+        # Complete mapping from all PLATFORM_MAPPINGS entries
+        "3do": "3DO Interactive Multiplayer",
+        "amiga": "Commodore Amiga",
+        "amstradcpc": "Amstrad CPC",
+        "apple2": "Apple II",
+        "arcade": "Arcade (FinalBurn Neo)",
+        "atari2600": "Atari 2600",
+        "atari5200": "Atari 5200",
+        "atari7800": "Atari 7800",
+        "atari800": "Atari 8-bit Family",
+        "atarijaguar": "Atari Jaguar",
+        "atarijaguarcd": "Atari Jaguar CD",
+        "atarilynx": "Atari Lynx",
+        "atarist": "Atari ST",
+        "atarixe": "Atari XE",
+        "atomiswave": "Atomiswave Arcade",
+        "c64": "Commodore 64",
+        "cannonball": "Cannonball (OutRun Engine)",
+        "coco": "TRS-80 Color Computer",
+        "coleco": "ColecoVision",
+        "colecovision": "ColecoVision",
+        "dragon32": "Dragon Data",
+        "dreamcast": "Sega Dreamcast",
+        "fds": "Famicom Disk System",
+        "famicom": "Nintendo Famicom", 
+        "gamegear": "Sega Game Gear",
+        "gb": "Game Boy",
+        "gba": "Game Boy Advance",
+        "gbc": "Game Boy Color",
+        "gc": "GameCube",
+        "genesis": "Sega Genesis",
+        "gizmondo": "Tiger Gizmondo",
+        "intellivision": "Mattel Intellivision",
+        "macintosh": "Apple Macintosh",
+        "mastersystem": "Sega Master System",
+        "megadrive": "Sega Mega Drive",
+        "msx": "MSX",
+        "n3ds": "Nintendo 3DS",
+        "n64": "Nintendo 64",
+        "n64dd": "Nintendo 64DD",
+        "nds": "Nintendo DS",
+        "neogeo": "Neo Geo",
+        "neogeocd": "Neo Geo CD",
+        "nes": "Nintendo Entertainment System",
+        "ngp": "Neo Geo Pocket",
+        "ngpc": "Neo Geo Pocket Color",
+        "odyssey2": "Magnavox Odyssey 2",
+        "othello": "Othello Multivision",
+        "pc": "PC (IBM Compatible)",
+        "pc98": "NEC PC-98",
+        "pcengine": "PC Engine",
+        "pcenginecd": "PC Engine CD",
+        "pokemini": "Pokemon Mini",
+        "pokitto": "Pokitto",
+        "ps2": "PlayStation 2",
+        "ps3": "PlayStation 3",
+        "ps4": "PlayStation 4",
+        "psp": "PlayStation Portable",
+        "psvita": "PlayStation Vita",
+        "psx": "PlayStation",
+        "satellaview": "Nintendo Satellaview",
+        "saturn": "Sega Saturn", 
+        "sega32x": "Sega 32X",
+        "segacd": "Sega CD",
+        "sfc": "Super Famicom",
+        "sg1000": "Sega SG-1000",
+        "snes": "Super Nintendo Entertainment System",
+        "supergrafx": "PC Engine SuperGrafx",
+        "supervision": "Watara Supervision",
+        "trs80": "TRS-80",
+        "turbografx": "TurboGrafx-16",
+        "turbografxcd": "TurboGrafx-16 CD",
+        "unknown": "Unknown Good Tool Collection",
+        "vectrex": "GCE Vectrex",
+        "virtualboy": "Virtual Boy",
+        "wii": "Wii",
+        "wiiu": "Wii U",
+        "wonderswan": "Bandai WonderSwan",
+        "wonderswancolor": "Bandai WonderSwan Color",
+        "x1": "Sharp X1",
+        "x68000": "Sharp X68000",
+        "xbox": "Microsoft Xbox",
+        "xbox360": "Microsoft Xbox 360",
+        "zxspectrum": "ZX Spectrum",
+    }
+    
+    CONSOLIDATED_DISPLAY_NAMES = {
+        "nes": "Nintendo Entertainment System (includes Famicom)",
+        "snes": "Super Nintendo Entertainment System (includes Super Famicom)",
+        "pcengine": "PC Engine (includes TurboGrafx-16)",
+    }
+    
     def __init__(self, regional_mode: str = "consolidated"):
         self.regional_mode = regional_mode
         
@@ -689,15 +935,35 @@ class RegionalPreferenceEngine:
                 "turbografx": [r".*TurboGrafx.*(?!\s+CD).*"],
             }
         }
+        
+        # The same rules as flat (platform, compiled pattern) lists, in priority order
+        self._separate_rules = self._compile_rules(self.always_separate)
+        self._regional_rules = self._compile_rules(self.regional_mappings["regional"])
+        
+        # (folder_name, detected_platform) -> target platform; the rules above are fixed per engine
+        self._target_cache: Dict[Tuple[str, str], str] = {}
+    
+    @staticmethod
+    def _compile_rules(rules: Dict[str, List[str]]) -> List[Tuple[str, 're.Pattern']]:
+        """Flatten a platform -> patterns mapping into precompiled case-insensitive rules"""
+        return [(platform, re.compile(pattern, re.IGNORECASE))
+                for platform, patterns in rules.items() for pattern in patterns]
     
     def get_target_platform(self, folder_name: str, detected_platform: str) -> str:
         """Determine final target platform based on regional preferences"""
+        cache_key = (folder_name, detected_platform)
+        target_platform = self._target_cache.get(cache_key)
+        if target_platform is None:
+            target_platform = self._target_cache[cache_key] = self._resolve_target_platform(folder_name, detected_platform)
+        return target_platform
+    
+    def _resolve_target_platform(self, folder_name: str, detected_platform: str) -> str:
+        """Uncached get_target_platform"""
         
         # Always separate significant variants first
-        for platform, patterns in self.always_separate.items():
-            for pattern in patterns:
-                if re.search(pattern, folder_name, re.IGNORECASE):
-                    return platform
+        for platform, pattern in self._separate_rules:
+            if pattern.search(folder_name):
+                return platform
         
         # Apply regional preference logic
         if self.regional_mode == "regional":
@@ -708,112 +974,21 @@ class RegionalPreferenceEngine:
     
     def _apply_regional_separation(self, folder_name: str, detected_platform: str) -> str:
         """Apply regional separation rules"""
-        for platform, patterns in self.regional_mappings["regional"].items():
-            for pattern in patterns:
-                if re.search(pattern, folder_name, re.IGNORECASE):
-                    return platform
+        for platform, pattern in self._regional_rules:
+            if pattern.search(folder_name):
+                return platform
         
         return detected_platform
     
     def get_display_name(self, platform: str) -> str:
         """Get appropriate display name for platform based on regional mode"""
-        display_mapping = {
-            # Complete mapping from all PLATFORM_MAPPINGS entries
-            "3do": "3DO Interactive Multiplayer",
-            "amiga": "Commodore Amiga",
-            "amstradcpc": "Amstrad CPC",
-            "apple2": "Apple II",
-            "arcade": "Arcade (FinalBurn Neo)",
-            "atari2600": "Atari 2600",
-            "atari5200": "Atari 5200",
-            "atari7800": "Atari 7800",
-            "atari800": "Atari 8-bit Family",
-            "atarijaguar": "Atari Jaguar",
-            "atarijaguarcd": "Atari Jaguar CD",
-            "atarilynx": "Atari Lynx",
-            "atarist": "Atari ST",
-            "atarixe": "Atari XE",
-            "atomiswave": "Atomiswave Arcade",
-            "c64": "Commodore 64",
-            "cannonball": "Cannonball (OutRun Engine)",
-            "coco": "TRS-80 Color Computer",
-            "coleco": "ColecoVision",
-            "colecovision": "ColecoVision",
-            "dragon32": "Dragon Data",
-            "dreamcast": "Sega Dreamcast",
-            "fds": "Famicom Disk System",
-            "famicom": "Nintendo Famicom", 
-            "gamegear": "Sega Game Gear",
-            "gb": "Game Boy",
-            "gba": "Game Boy Advance",
-            "gbc": "Game Boy Color",
-            "gc": "GameCube",
-            "genesis": "Sega Genesis",
-            "gizmondo": "Tiger Gizmondo",
-            "intellivision": "Mattel Intellivision",
-            "macintosh": "Apple Macintosh",
-            "mastersystem": "Sega Master System",
-            "megadrive": "Sega Mega Drive",
-            "msx": "MSX",
-            "n3ds": "Nintendo 3DS",
-            "n64": "Nintendo 64",
-            "n64dd": "Nintendo 64DD",
-            "nds": "Nintendo DS",
-            "neogeo": "Neo Geo",
-            "neogeocd": "Neo Geo CD",
-            "nes": "Nintendo Entertainment System",
-            "ngp": "Neo Geo Pocket",
-            "ngpc": "Neo Geo Pocket Color",
-            "odyssey2": "Magnavox Odyssey 2",
-            "othello": "Othello Multivision",
-            "pc": "PC (IBM Compatible)",
-            "pc98": "NEC PC-98",
-            "pcengine": "PC Engine",
-            "pcenginecd": "PC Engine CD",
-            "pokemini": "Pokemon Mini",
-            "pokitto": "Pokitto",
-            "ps2": "PlayStation 2",
-            "ps3": "PlayStation 3",
-            "ps4": "PlayStation 4",
-            "psp": "PlayStation Portable",
-            "psvita": "PlayStation Vita",
-            "psx": "PlayStation",
-            "satellaview": "Nintendo Satellaview",
-            "saturn": "Sega Saturn", 
-            "sega32x": "Sega 32X",
-            "segacd": "Sega CD",
-            "sfc": "Super Famicom",
-            "sg1000": "Sega SG-1000",
-            "snes": "Super Nintendo Entertainment System",
-            "supergrafx": "PC Engine SuperGrafx",
-            "supervision": "Watara Supervision",
-            "trs80": "TRS-80",
-            "turbografx": "TurboGrafx-16",
-            "turbografxcd": "TurboGrafx-16 CD",
-            "unknown": "Unknown Good Tool Collection",
-            "vectrex": "GCE Vectrex",
-            "virtualboy": "Virtual Boy",
-            "wii": "Wii",
-            "wiiu": "Wii U",
-            "wonderswan": "Bandai WonderSwan",
-            "wonderswancolor": "Bandai WonderSwan Color",
-            "x1": "Sharp X1",
-            "x68000": "Sharp X68000",
-            "xbox": "Microsoft Xbox",
-            "xbox360": "Microsoft Xbox 360",
-            "zxspectrum": "ZX Spectrum",
-        }
-        
         if self.regional_mode == "consolidated":
             # Show consolidated names with context
-            consolidated_names = {
-                "nes": "Nintendo Entertainment System (includes Famicom)",
-                "snes": "Super Nintendo Entertainment System (includes Super Famicom)",
-                "pcengine": "PC Engine (includes TurboGrafx-16)",
-            }
-            return consolidated_names.get(platform, display_mapping.get(platform, platform))
+            consolidated_name = self.CONSOLIDATED_DISPLAY_NAMES.get(platform)
+            if consolidated_name:
+                return consolidated_name
         
-        return display_mapping.get(platform, platform)
+        return self.DISPLAY_NAMES.get(platform, platform)
 
 def is_wsl2_mount(path: Path) -> bool:
     """Check if path is on WSL2 Windows mount"""
@@ -880,15 +1055,18 @@ def copy_file_simple_wsl2(source_path: Path, target_file_path: Path, operations_
         # Increased delay for WSL2 9p protocol stability
         time.sleep(0.01)  # 10ms delay (increased from 1ms)
         
-        # Verify copy was successful
-        if not target_file_path.exists() or target_file_path.stat().st_size == 0:
+        # Verify copy was successful with a single stat (covers existence and size)
+        try:
+            target_size = target_file_path.stat().st_size
+        except FileNotFoundError:
+            target_size = 0
+        if target_size == 0:
             error_msg = f"WSL2 copy verification failed: {target_file_path}"
             if operations_logger:
                 operations_logger.warning(error_msg)
             return False, error_msg
         
         # Verify file size matches
-        target_size = target_file_path.stat().st_size
         if target_size != source_size:
             error_msg = f"WSL2 copy size mismatch: {source_path} ({source_size} vs {target_size})"
             if operations_logger:
@@ -905,7 +1083,43 @@ def copy_file_simple_wsl2(source_path: Path, target_file_path: Path, operations_
             operations_logger.error(f"WSL2 copy failed: {source_path} -> {target_file_path}: {error_msg}")
         return False, error_msg
 
-def calculate_sha1(file_path, chunk_size=65536):
+# Logical CPU count, read once (os.cpu_count() re-reads /sys on Linux for every call)
+_CPU_COUNT = os.cpu_count() or 1
+# Per-thread read buffer shared by the hashing/CRC loops (avoids one bytes allocation per chunk)
+READ_BUFFER_SIZE = 1 << 20
+# Files at least this large are hashed through mmap instead of buffered reads
+MMAP_HASH_THRESHOLD = 64 << 20
+# SHA1 is a content fingerprint here, not a security primitive: usedforsecurity=False (3.9+)
+# keeps FIPS-mode OpenSSL builds from refusing it and lets them use the accelerated implementation
+if sys.version_info >= (3, 9):
+    def _new_sha1():
+        return hashlib.sha1(usedforsecurity=False)
+else:
+    _new_sha1 = hashlib.sha1
+# Whole-file mappings need a 64-bit address space: 32-bit builds cannot map multi-GB disc images
+_MMAP_HASH_SUPPORTED = sys.maxsize > 2**32
+_thread_buffers = threading.local()
+
+def read_file_chunks(f, chunk_size: int = READ_BUFFER_SIZE):
+    """Yield memoryview slices of an open binary file read into a reusable per-thread buffer
+    
+    Each slice is only valid until the next iteration, so consume it immediately.
+    """
+    buffer = getattr(_thread_buffers, 'buffer', None)
+    if buffer is None or len(buffer) < chunk_size:
+        buffer = _thread_buffers.buffer = bytearray(chunk_size)
+    view = memoryview(buffer)[:chunk_size]
+    
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Readahead hint only
+    
+    while bytes_read := f.readinto(view):
+        yield view[:bytes_read]
+
+def calculate_sha1(file_path, chunk_size=READ_BUFFER_SIZE):
     """Calculate SHA1 hash with optimal method selection based on file size"""
     import mmap
     
@@ -913,19 +1127,25 @@ def calculate_sha1(file_path, chunk_size=65536):
     
     try:
         file_size = file_path.stat().st_size
-        sha1_hash = hashlib.sha1()
-        
-        # Use memory mapping for files larger than 100MB for efficiency
-        if file_size > 100 * 1024 * 1024:  # 100MB threshold
-            with open(file_path, 'rb') as f:
-                # Memory-mapped reading for large files
-                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mmapped:
-                    sha1_hash.update(mmapped)
-        else:
-            # Chunked reading for smaller files (better for concurrent operations)
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(chunk_size):
-                    sha1_hash.update(chunk)
+        sha1_hash = _new_sha1()
+        
+        # Large images: hash straight from the page cache, with a sequential readahead hint
+        if file_size >= MMAP_HASH_THRESHOLD and _MMAP_HASH_SUPPORTED:
+            try:
+                with open(file_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mmapped:
+                        if hasattr(mmapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mmapped.madvise(mmap.MADV_SEQUENTIAL)
+                        sha1_hash.update(mmapped)
+                return sha1_hash.hexdigest()
+            except (OSError, ValueError, OverflowError):
+                # Mapping refused (address space, section limits, special files): read in chunks
+                sha1_hash = _new_sha1()
+        
+        # Chunked reading for smaller files (better for concurrent operations)
+        with open(file_path, 'rb') as f:
+            for chunk in read_file_chunks(f, chunk_size):
+                sha1_hash.update(chunk)
         
         return sha1_hash.hexdigest()
     
@@ -936,6 +1156,144 @@ def calculate_sha1(file_path, chunk_size=65536):
         # Return None for any other error during hash calculation
         return None
 
+class HashCache:
+    """Persistent SHA1 store keyed by (absolute path, size, mtime_ns)
+    
+    Re-runs over an unchanged collection answer duplicate checks with one stat()
+    per file instead of re-reading it. New digests are buffered and written in
+    one transaction per batch (and per platform shard in --processes mode).
+    """
+    
+    BATCH_SIZE = 512
+    
+    def __init__(self, db_path: Path, rebuild: bool = False):
+        self.db_path = Path(db_path)
+        self.hits = 0
+        self.misses = 0
+        self._pending = []
+        self._lock = Lock()
+        # One connection shared by the copy threads, serialized by self._lock
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS hashes("
+                           "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha1 TEXT)")
+        if rebuild:
+            self._conn.execute("DELETE FROM hashes")
+        self._conn.commit()
+    
+    def sha1(self, file_path) -> Optional[str]:
+        """Cached SHA1 for an unchanged file, otherwise hash it and queue the result"""
+        path = os.path.abspath(file_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (path, st.st_size, st.st_mtime_ns)
+        
+        with self._lock:
+            row = self._conn.execute("SELECT sha1 FROM hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                                     key).fetchone()
+            if row:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+        
+        digest = calculate_sha1(path)
+        if digest is not None:
+            with self._lock:
+                self._pending.append(key + (digest,))
+                if len(self._pending) >= self.BATCH_SIZE:
+                    self._write_pending()
+        return digest
+    
+    def cached(self, file_path) -> Optional[str]:
+        """Stored SHA1 for an unchanged file, or None; never reads the file itself"""
+        path = os.path.abspath(file_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT sha1 FROM hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                                     (path, st.st_size, st.st_mtime_ns)).fetchone()
+        return row[0] if row else None
+    
+    def _write_pending(self) -> None:
+        if self._pending:
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)", self._pending)
+            self._pending.clear()
+    
+    def flush(self) -> None:
+        """Write queued digests in a single transaction"""
+        with self._lock:
+            self._write_pending()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._write_pending()
+            self._conn.close()
+
+# Process-wide cache used by file_sha1(); None hashes every file from scratch
+_hash_cache: Optional[HashCache] = None
+
+def open_hash_cache(db_path: Path, rebuild: bool = False, logger: logging.Logger = None) -> Optional[HashCache]:
+    """Open the persistent hash cache for this process (the run continues without one on error)"""
+    global _hash_cache
+    try:
+        _hash_cache = HashCache(db_path, rebuild)
+        atexit.register(_hash_cache.close)
+    except sqlite3.Error as e:
+        _hash_cache = None
+        if logger:
+            logger.warning(f"Hash cache unavailable ({db_path}): {e} - hashing without cache")
+    return _hash_cache
+
+def file_sha1(file_path) -> Optional[str]:
+    """SHA1 of a file, answered from the persistent hash cache when one is open"""
+    if _hash_cache is None:
+        return calculate_sha1(file_path)
+    return _hash_cache.sha1(file_path)
+
+def cached_file_sha1(file_path) -> Optional[str]:
+    """SHA1 already stored in the persistent hash cache for an unchanged file, else None"""
+    if _hash_cache is None:
+        return None
+    return _hash_cache.cached(file_path)
+
+def _read_block(f, offset: int, size: int) -> bytes:
+    """Positioned read: one pread() where available, seek+read otherwise (Windows)"""
+    if hasattr(os, 'pread'):
+        return os.pread(f.fileno(), size, offset)
+    f.seek(offset)
+    return f.read(size)
+
+def file_samples_differ(source_path: Path, target_path: Path, file_size: int, block_size: int = 65536) -> bool:
+    """Cheap reject for same-size files: compare the first, middle and last block before any full hash
+    
+    ROM headers and trailing padding differ between most non-identical dumps; the middle
+    block also catches patched or hacked dumps that keep the original header. Files up to
+    three blocks long are covered completely by the head and tail reads.
+    """
+    offsets = [0]
+    if file_size > block_size:
+        if file_size > 2 * block_size:
+            offsets.append((file_size - block_size) // 2)
+        offsets.append(max(block_size, file_size - block_size))
+    
+    with open(source_path, 'rb') as source_file, open(target_path, 'rb') as target_file:
+        if len(offsets) > 2 and hasattr(os, 'posix_fadvise'):
+            # Three scattered blocks: stop readahead from pulling in pages around each one
+            for sampled_file in (source_file, target_file):
+                try:
+                    os.posix_fadvise(sampled_file.fileno(), 0, 0, os.POSIX_FADV_RANDOM)
+                except OSError:
+                    pass  # Access-pattern hint only
+        for offset in offsets:
+            if _read_block(source_file, offset, block_size) != _read_block(target_file, offset, block_size):
+                return True
+    return False
+
 def should_copy_file(source_path, target_path, operations_logger=None):
     """Determine if file needs copying based on existence, size, and SHA1 hash comparison
     
@@ -957,12 +1315,18 @@ def should_copy_file(source_path, target_path, operations_logger=None):
         # Different sizes = different files, need to copy
         if source_size != target_size:
             if operations_logger:
-                operations_logger.debug(f"Size mismatch for {source_path.name}: source={source_size}, target={target_size}")
+                operations_logger.debug("Size mismatch for %s: source=%d, target=%d", source_path.name, source_size, target_size)
             return True, "size_mismatch", {"action": "replace", "source_size": source_size, "target_size": target_size}
         
-        # Same size - need SHA1 comparison to determine if identical
-        source_hash = calculate_sha1(source_path)
-        target_hash = calculate_sha1(target_path)
+        # Same size - a differing sampled block settles it without hashing
+        if file_samples_differ(source_path, target_path, source_size):
+            if operations_logger:
+                operations_logger.debug("Content mismatch in sampled blocks for %s", source_path.name)
+            return True, "sample_mismatch", {"action": "replace"}
+        
+        # Same size and matching samples - need SHA1 comparison to determine if identical
+        source_hash = file_sha1(source_path)
+        target_hash = file_sha1(target_path)
         
         # Handle hash calculation failures
         if source_hash is None:
@@ -978,11 +1342,11 @@ def should_copy_file(source_path, target_path, operations_logger=None):
         # Compare hashes
         if source_hash == target_hash:
             if operations_logger:
-                operations_logger.debug(f"Files identical (SHA1: {source_hash[:8]}...): {source_path.name}")
+                operations_logger.debug("Files identical (SHA1: %.8s...): %s", source_hash, source_path.name)
             return False, "identical_hash", {"action": "skip", "hash": source_hash}
         else:
             if operations_logger:
-                operations_logger.debug(f"Hash mismatch for {source_path.name}: source={source_hash[:8]}..., target={target_hash[:8]}...")
+                operations_logger.debug("Hash mismatch for %s: source=%.8s..., target=%.8s...", source_path.name, source_hash, target_hash)
             return True, "hash_mismatch", {"action": "replace", "source_hash": source_hash, "target_hash": target_hash}
     
     except Exception as e:
@@ -1037,21 +1401,75 @@ def display_unified_progress(emoji: str, label: str, current: int, total: int,
     # Display with carriage return for same-line updates
     print(f"\r{progress_display}", end='', flush=True)
 
-def count_rom_files_in_directory(directory_path: Path, rom_extensions: set = None) -> int:
+def file_extension(name: str) -> str:
+    """Lowercased extension of a bare filename, matching Path(name).suffix.lower() without a Path object"""
+    dot = name.rfind('.')
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ''
+
+def iter_file_entries(directory_path):
+    """Yield DirEntry objects for all non-directories below a directory using os.scandir
+    
+    Mirrors os.walk's defaults: unreadable directories are skipped and symlinked
+    directories are not descended into. DirEntry's cached type avoids a stat per entry.
+    """
+    pending = [directory_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            pending.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+
+def iter_file_names(directory_path):
+    """Yield the names of all files below a directory (see iter_file_entries)"""
+    for entry in iter_file_entries(directory_path):
+        yield entry.name
+
+def count_file_extensions(directory_path) -> Counter:
+    """Recursive per-extension file counts for one directory (see file_extension)"""
+    return Counter(map(file_extension, iter_file_names(directory_path)))
+
+def scan_rom_files(directory_path) -> Tuple[List[Path], Counter]:
+    """ROM file paths below a directory, plus per-extension counts of the other files"""
+    rom_files = []
+    other_extensions = Counter()
+    for entry in iter_file_entries(directory_path):
+        if entry.is_file():
+            extension = file_extension(entry.name)
+            if extension in ROM_EXTENSIONS:
+                rom_files.append(Path(entry.path))
+            else:
+                other_extensions[extension] += 1
+    return rom_files, other_extensions
+
+def map_directory_scans(scan, directories: List[Path], serial: bool = False):
+    """Yield scan(directory) for each directory, in order
+    
+    Directory walks are independent and syscall-bound, so they run on a thread pool
+    unless serial is set (WSL2 Windows mounts: 9p degrades under concurrent I/O).
+    """
+    if serial or len(directories) < 2:
+        yield from map(scan, directories)
+        return
+    
+    max_workers = min(len(directories), 32, _CPU_COUNT * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(scan, directories)
+
+def count_rom_files_in_directory(directory_path: Path, rom_extensions: frozenset = None) -> int:
     """Count ROM files in a directory recursively"""
-    if rom_extensions is None:
-        rom_extensions = ROM_EXTENSIONS
+    suffixes = ROM_EXTENSION_SUFFIXES if rom_extensions is None else tuple(rom_extensions)
     
     rom_file_count = 0
-    try:
-        for root, dirs, files in os.walk(directory_path):
-            for file in files:
-                if Path(file).suffix.lower() in rom_extensions:
-                    rom_file_count += 1
-    except (OSError, PermissionError):
-        # If we can't access the directory, return 0
-        pass
-    
+    for name in iter_file_names(directory_path):
+        # rfind > 0 keeps Path.suffix semantics: a bare dotfile such as '.nes' has no extension
+        if name.lower().endswith(suffixes) and name.rfind('.') > 0:
+            rom_file_count += 1
     return rom_file_count
 
 def calculate_crc32(file_path: Path) -> int:
@@ -1059,21 +1477,71 @@ def calculate_crc32(file_path: Path) -> int:
     import zlib
     crc = 0
     with open(file_path, 'rb') as f:
-        while chunk := f.read(65536):  # 64KB chunks
+        for chunk in read_file_chunks(f):
             crc = zlib.crc32(chunk, crc)
     return crc & 0xffffffff  # Ensure positive value
 
-def copy_file_with_verification(source_path: Path, target_path: Path, operations_logger=None) -> tuple[bool, str]:
-    """Direct copy with CRC32 verification - no temp files"""
+def flush_file_to_disk(file_path: Path) -> None:
+    """Flush one file's data to stable storage (fdatasync where available, else fsync)"""
+    # Windows FlushFileBuffers needs a writable handle, so open read/write without truncating
+    with open(file_path, 'rb+') as f:
+        if hasattr(os, 'fdatasync'):
+            os.fdatasync(f.fileno())
+        else:
+            os.fsync(f.fileno())
+
+# copy_file_range errors that mean "not supported for this file pair" rather than a real I/O failure
+_COPY_RANGE_FALLBACK_ERRNOS = frozenset({errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP,
+                                         errno.ETXTBSY, errno.EPERM})
+_COPY_RANGE_CHUNK = 1 << 30
+_copy_file_range_supported = hasattr(os, 'copy_file_range')
+
+def copy_file_data(source_path: Path, target_path: Path) -> None:
+    """Copy contents and metadata like shutil.copy2, using copy_file_range where available
+    
+    copy_file_range lets the kernel/filesystem move the bytes itself (reflinks on btrfs/XFS,
+    server-side copy on NFS/CIFS) instead of round-tripping them through user space.
+    Cross-device pairs and kernels without the syscall fall back to shutil.copy2.
+    """
+    global _copy_file_range_supported
+    if _copy_file_range_supported:
+        try:
+            with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                while os.copy_file_range(src_fd, dst_fd, _COPY_RANGE_CHUNK):
+                    pass
+        except OSError as e:
+            if e.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+                raise
+            if e.errno == errno.ENOSYS:
+                _copy_file_range_supported = False
+        else:
+            shutil.copystat(source_path, target_path)
+            return
+    
+    shutil.copy2(source_path, target_path)
+
+def copy_file_with_verification(source_path: Path, target_path: Path, operations_logger=None,
+                                create_parent: bool = True, durable: bool = False) -> tuple[bool, str]:
+    """Direct copy with CRC32 verification - no temp files
+    
+    Callers that pre-create target directories once per platform pass
+    create_parent=False to skip the per-file mkdir syscall. durable=True
+    flushes just this file to disk after the copy.
+    """
     import time
     import platform
     
     try:
         # Ensure target directory exists
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        if create_parent:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Direct copy with no temp files
-        shutil.copy2(source_path, target_path)
+        copy_file_data(source_path, target_path)
+        
+        if durable:
+            flush_file_to_disk(target_path)
         
         # Windows AV compatibility: adaptive pause based on file size
         if platform.system() == 'Windows':
@@ -1136,7 +1604,7 @@ def copy_file_with_retry(source_path: Path, target_path: Path, operations_logger
         
         if success:
             if operations_logger:
-                operations_logger.debug(f"Copy successful on attempt {attempt + 1}: {source_path.name} - {info}")
+                operations_logger.debug("Copy successful on attempt %d: %s - %s", attempt + 1, source_path.name, info)
             return True, info
             
         # Log the attempt failure
@@ -1450,9 +1918,9 @@ class ModernTerminalDisplay:
         lines.append("")
         lines.append("[Press CTRL+C to pause, Q to quit, V for verbose mode, L to view log]")
         
-        # Print all lines
-        for line in lines:
-            print(line)
+        # Print all lines in one write rather than one print (and stdout lock) per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
             
         self.display_lines = len(lines)
         
@@ -1564,8 +2032,10 @@ def get_unique_target_path(
     target_dir: Path, 
     platform: str,
     source_folder_name: str,
-    existing_paths: Set[str],
-    operations_logger
+    claimed_names: Optional[Set[str]],
+    operations_logger,
+    trusted_names: Optional[frozenset] = None,
+    claim_lock: Optional[Lock] = None
 ) -> Tuple[Path, Optional[str]]:
     """Generate collision-free target path with intelligent duplicate handling
     
@@ -1574,14 +2044,28 @@ def get_unique_target_path(
         target_dir: Base target directory
         platform: Target platform shortcode
         source_folder_name: Name of source folder (for hint extraction)
-        existing_paths: Set of target paths already claimed
+        claimed_names: Normcased filenames already on disk or claimed in
+            target_dir/platform (one set per platform, seeded by
+            build_target_index()). The returned name is added to it.
+            Pass None to fall back to per-candidate exists() checks.
         operations_logger: Logger for debugging
+        trusted_names: Normcased names that were in target_dir/platform before
+            this run. A collision with one of them whose size, mtime_ns and
+            sampled blocks match the source is compared against the digest the
+            hash cache already holds for the target, so the target is not read
+            again; it counts as identical only when that digest equals the
+            source's SHA1. None always goes through file_sha1() for both.
+        claim_lock: Lock shared by threads using the same claimed_names. It is
+            held only while a name is checked and claimed; the stat, sample and
+            SHA1 comparison of a collision runs outside it.
     
     Returns:
         Tuple of (unique_target_path, rename_reason)
         rename_reason can be:
         - None: Original name used
         - "skip_identical": File is truly identical, should skip
+        - "skip_identical_metadata": Source SHA1 equals the cached digest of an
+          unchanged pre-run target, should skip (target not re-read)
         - "renamed_with_hint_X": Renamed using folder hint
         - "renamed_with_number_X": Renamed with numbered suffix
         - "error_too_many_duplicates": Unable to find unique name
@@ -1590,21 +2074,51 @@ def get_unique_target_path(
     stem = source_path.stem  # Filename without extension
     suffix = source_path.suffix  # Extension including dot
     
+    guard = claim_lock if claim_lock is not None else nullcontext()
+    
+    def is_taken(path: Path) -> bool:
+        if claimed_names is None:
+            return path.exists()
+        return os.path.normcase(path.name) in claimed_names
+    
+    def claim(path: Path) -> Path:
+        if claimed_names is not None:
+            claimed_names.add(os.path.normcase(path.name))
+        return path
+    
     base_target = target_dir / platform / filename
-    base_target_str = str(base_target)
     
     # First file with this name - use as-is
-    if (base_target_str not in existing_paths and not base_target.exists()):
-        return base_target, None
+    with guard:
+        if not is_taken(base_target):
+            return claim(base_target), None
     
-    # Path collision detected - check if truly identical via SHA1
-    if base_target.exists():
+    # Path collision detected - check if truly identical: size, then sampled blocks, then SHA1
+    try:
+        source_stat = source_path.stat()
+        target_stat = base_target.stat()
+    except OSError:
+        # Name claimed by a copy that is not on disk (yet), or source unreadable
+        source_stat = target_stat = None
+    if source_stat is not None and source_stat.st_size == target_stat.st_size:
         try:
-            source_hash = calculate_sha1(source_path)
-            target_hash = calculate_sha1(base_target)
-            if source_hash and target_hash and source_hash == target_hash:
-                operations_logger.debug(f"Truly identical file detected via SHA1: {filename}")
-                return base_target, "skip_identical"
+            # Sampled blocks always come first: matching size and mtime alone proves nothing
+            # (TorrentZip'd sets stamp every file with the same fixed mtime)
+            if not file_samples_differ(source_path, base_target, source_stat.st_size):
+                source_hash = file_sha1(source_path)
+                target_hash = None
+                if (trusted_names is not None and source_stat.st_mtime_ns == target_stat.st_mtime_ns
+                        and os.path.normcase(filename) in trusted_names):
+                    # The target's stored digest must match the source's; its mere presence proves nothing
+                    target_hash = cached_file_sha1(base_target)
+                    if source_hash and target_hash == source_hash:
+                        operations_logger.debug("Identical file detected via cached SHA1 of unchanged target: %s", filename)
+                        return base_target, "skip_identical_metadata"
+                if target_hash is None:
+                    target_hash = file_sha1(base_target)
+                if source_hash and target_hash and source_hash == target_hash:
+                    operations_logger.debug("Truly identical file detected via SHA1: %s", filename)
+                    return base_target, "skip_identical"
         except Exception as e:
             operations_logger.warning(f"SHA1 comparison failed for {filename}: {e}")
     
@@ -1613,50 +2127,69 @@ def get_unique_target_path(
     
     # Strategy 1: Try using source folder hint
     folder_hint = extract_folder_hint(source_folder_name) if source_folder_name else None
-    if folder_hint:
-        unique_name = f"{stem} ({folder_hint}){suffix}"
-        unique_path = target_dir / platform / unique_name
-        unique_path_str = str(unique_path)
-        
-        if (unique_path_str not in existing_paths and not unique_path.exists()):
-            operations_logger.info(f"Using folder hint for rename: {filename} -> {unique_name}")
-            return unique_path, f"renamed_with_hint_{folder_hint}"
-    
-    # Strategy 2: Fall back to numbered suffix (2), (3), etc.
-    counter = 2
-    while counter < 100:
-        unique_name = f"{stem} ({counter}){suffix}"
-        unique_path = target_dir / platform / unique_name
-        unique_path_str = str(unique_path)
-        
-        if (unique_path_str not in existing_paths and not unique_path.exists()):
-            operations_logger.info(f"Using numbered suffix for rename: {filename} -> {unique_name}")
-            return unique_path, f"renamed_with_number_{counter}"
-        counter += 1
+    with guard:
+        if folder_hint:
+            unique_name = f"{stem} ({folder_hint}){suffix}"
+            unique_path = target_dir / platform / unique_name
+            
+            if not is_taken(unique_path):
+                operations_logger.info(f"Using folder hint for rename: {filename} -> {unique_name}")
+                return claim(unique_path), f"renamed_with_hint_{folder_hint}"
+        
+        # Strategy 2: Fall back to numbered suffix (2), (3), etc.
+        counter = 2
+        while counter < 100:
+            unique_name = f"{stem} ({counter}){suffix}"
+            unique_path = target_dir / platform / unique_name
+            
+            if not is_taken(unique_path):
+                operations_logger.info(f"Using numbered suffix for rename: {filename} -> {unique_name}")
+                return claim(unique_path), f"renamed_with_number_{counter}"
+            counter += 1
     
     # Should never reach here - emergency fallback
     operations_logger.error(f"Unable to find unique name for {filename} after 99 attempts")
     return base_target, "error_too_many_duplicates"
 
+def build_target_index(target_dir: Path, platform_codes) -> Dict[str, Set[str]]:
+    """Snapshot existing target filenames with one scandir per platform directory
+    
+    Names are normcased so lookups match the filesystem's case rules on Windows.
+    Missing platform directories map to an empty set.
+    """
+    target_index = {}
+    for platform in platform_codes:
+        try:
+            with os.scandir(target_dir / platform) as entries:
+                target_index[platform] = {os.path.normcase(entry.name) for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            target_index[platform] = set()
+    return target_index
+
 def count_files_in_directory(target_dir: Path) -> int:
     """Count actual ROM files in target directory for validation"""
     if not target_dir.exists():
         return 0
     
-    count = 0
-    for ext in ROM_EXTENSIONS:
-        count += len(list(target_dir.rglob(f"*{ext}")))
-    return count
+    # One walk, classified like discovery (file_extension) so each file counts once
+    return sum(1 for name in iter_file_names(target_dir) if file_extension(name) in ROM_EXTENSIONS)
 
 class AsyncFileCopyEngine:
     """Adaptive file copying engine that automatically optimizes for filesystem type"""
     
-    def __init__(self, operations_logger, errors_logger, progress_logger, dry_run=False, shutdown_handler=None):
+    def __init__(self, operations_logger, errors_logger, progress_logger, dry_run=False, shutdown_handler=None,
+                 processes: int = 1, paranoid_hash: bool = False, skip_identical: bool = True,
+                 pin_threads: bool = False):
         self.operations_logger = operations_logger
         self.errors_logger = errors_logger
         self.progress_logger = progress_logger
         self.dry_run = dry_run
         self.shutdown_handler = shutdown_handler
+        self.processes = processes or 1
+        self.paranoid_hash = paranoid_hash  # No cached-target-digest shortcut for collisions
+        self.skip_identical = skip_identical  # False (--no-skip-identical) also disables the metadata shortcut
+        self.pin_threads = pin_threads  # Opt-in (--pin-threads); never set in --processes workers
+        self.show_progress = True  # Disabled in worker processes; the parent draws progress
         
         # Environment detection
         self.is_wsl2 = self._detect_wsl2()
@@ -1709,6 +2242,31 @@ class AsyncFileCopyEngine:
                 'description': 'High-concurrency strategy for native Linux filesystems'
             }
     
+    def size_workers_to_files(self, files: List[Path], sample_size: int = 256) -> int:
+        """Pick a copy thread count from a sample of file sizes (used when --threads is not given)
+        
+        Many small files are latency-bound and gain from more threads; large files are
+        bandwidth-bound, where extra threads mostly add seek contention. Small-file
+        workloads get one thread per doubling of total size above 8 MiB.
+        """
+        step = max(1, len(files) // sample_size)
+        sizes = []
+        for file_path in files[::step]:
+            try:
+                sizes.append(os.stat(file_path).st_size)
+            except OSError:
+                pass
+        if not sizes:
+            return self.max_workers
+        
+        # Copy threads spend their time blocked in I/O, so the cap is the strategy's, not the CPU count
+        limit = self.strategy.get('max_workers', 8)
+        if statistics.median(sizes) >= 4 * 1024 * 1024:
+            return min(4, limit)
+        
+        estimated_total_bytes = sum(sizes) * len(files) // len(sizes)
+        return max(1, min(limit, (estimated_total_bytes // (8 * 1024 * 1024)).bit_length()))
+    
     def copy_files_adaptive(self, files_by_folder, platforms, target_dir, update_progress_callback) -> ProcessingStats:
         """Adaptive file copying with filesystem-aware optimization"""
         stats = ProcessingStats()
@@ -1717,6 +2275,10 @@ class AsyncFileCopyEngine:
         self.operations_logger.info(f"Starting adaptive file copying with {self.strategy['name']}")
         self.operations_logger.debug(f"WSL2 DEBUG - Processing {len(files_by_folder)} folders with {self.max_workers} workers")
         
+        # Dry runs never copy, so none of the copy strategies below apply
+        if self.dry_run:
+            return self._process_dry_run(files_by_folder, platforms, target_dir)
+        
         # Check if WSL2 with Windows mounts requires single-threaded processing
         use_single_threaded = False
         if self.is_wsl2 and any(self._is_windows_mount(Path(folder)) for folder in files_by_folder.keys()):
@@ -1726,9 +2288,141 @@ class AsyncFileCopyEngine:
         # Route to appropriate processing method
         if use_single_threaded:
             return self._process_single_threaded(files_by_folder, platforms, target_dir, update_progress_callback)
+        elif self.processes > 1:
+            return self._process_multiprocess(files_by_folder, platforms, target_dir)
         else:
             return self._process_concurrent(files_by_folder, platforms, target_dir, update_progress_callback)
     
+    def _prepare_target_dirs(self, files_by_folder, platforms, target_dir, stats: ProcessingStats) -> Dict[str, Set[str]]:
+        """Create each target platform directory once up front instead of once per file
+        
+        Returns the build_target_index() snapshot for those directories so
+        duplicate checks can skip per-file exists() calls.
+        """
+        platform_dirs = {
+            target_dir / file_info['platform']
+            for folder_files in files_by_folder.values()
+            for file_info in folder_files
+            if isinstance(file_info, dict) and (not platforms or file_info['platform'] in platforms)
+        }
+        
+        missing_dirs = [platform_dir for platform_dir in platform_dirs if not platform_dir.exists()]
+        if self.dry_run:
+            # Nothing is created in a dry run, so folders_created stays as it was
+            self.operations_logger.debug(f"[DRY RUN] Would create {len(missing_dirs)} of {len(platform_dirs)} target platform directories")
+        else:
+            for platform_dir in missing_dirs:
+                try:
+                    platform_dir.mkdir(parents=True)
+                except FileExistsError:
+                    continue  # Created meanwhile by another worker process
+                stats.folders_created.add(str(platform_dir))
+            self.operations_logger.debug(f"Prepared {len(platform_dirs)} target platform directories ({len(stats.folders_created)} new)")
+        return build_target_index(target_dir, (platform_dir.name for platform_dir in platform_dirs))
+    
+    def _trusted_target_names(self, target_index: Dict[str, Set[str]]) -> Dict[str, frozenset]:
+        """Snapshot of pre-run target names for get_unique_target_path's size+mtime shortcut"""
+        if self.paranoid_hash or not self.skip_identical:
+            return {}
+        return {platform: frozenset(names) for platform, names in target_index.items()}
+    
+    def _plan_folder_files(self, folder_files, platforms, target_dir) -> List[Tuple[Path, str, str]]:
+        """Resolve (source_path, platform_shortcode, source_folder_name) for every file in a folder
+        
+        Dict entries from _group_files_by_folder already carry their platform. Plain
+        path entries fall back to matching against platform source folders, which is
+        resolved once per parent directory rather than once per file.
+        """
+        plan = []
+        fallback_by_parent = {}
+        
+        for file_info in folder_files:
+            # Handle dict structure from _group_files_by_folder
+            if isinstance(file_info, dict):
+                source_path = Path(file_info['path'])
+                plan.append((source_path, file_info['platform'], source_path.parent.name))
+                continue
+            
+            source_path = Path(file_info)
+            parent = source_path.parent
+            if parent not in fallback_by_parent:
+                fallback_by_parent[parent] = self._match_platform_for_parent(parent, platforms)
+                # Plain path entries were not covered by _prepare_target_dirs
+                if not self.dry_run:
+                    (target_dir / fallback_by_parent[parent][0]).mkdir(parents=True, exist_ok=True)
+            platform_shortcode, source_folder_name = fallback_by_parent[parent]
+            plan.append((source_path, platform_shortcode, source_folder_name))
+        
+        return plan
+    
+    def _match_platform_for_parent(self, parent: Path, platforms) -> Tuple[str, str]:
+        """Find the platform whose source folder contains this directory, else derive one from its name"""
+        parent_str = str(parent)
+        for platform_code, platform_info in (platforms or {}).items():
+            for source_folder in platform_info.source_folders:
+                if parent_str.endswith(source_folder) or source_folder in parent_str:
+                    return platform_code, source_folder
+        
+        return parent.name.lower(), parent.name
+    
+    def _process_dry_run(self, files_by_folder, platforms, target_dir) -> ProcessingStats:
+        """Dry-run specialization: resolve every target name and tally outcomes without copy machinery
+        
+        Runs on the calling thread with no executor, locks or retry logic, since
+        there is no copy I/O to overlap. Duplicate detection still reads the
+        existing target tree, so the tallies match what a live run would do.
+        """
+        stats = ProcessingStats()
+        total_files = sum(map(len, files_by_folder.values()))
+        stats.files_found = total_files
+        target_index = self._prepare_target_dirs(files_by_folder, platforms, target_dir, stats)
+        trusted_names = self._trusted_target_names(target_index)
+        
+        self.operations_logger.info(f"Dry run: planning {total_files} files across {len(files_by_folder)} folders")
+        log_debug = self.operations_logger.debug
+        debug_enabled = self.operations_logger.isEnabledFor(logging.DEBUG)
+        
+        processed_files = 0
+        for folder_path, folder_files in files_by_folder.items():
+            if self.shutdown_handler and self.shutdown_handler.check_shutdown():
+                self.operations_logger.info("Shutdown requested, stopping dry-run planning")
+                break
+            
+            for source_path, platform_shortcode, source_folder_name in self._plan_folder_files(folder_files, platforms, target_dir):
+                if platform_shortcode not in target_index:
+                    target_index.update(build_target_index(target_dir, [platform_shortcode]))
+                target_file_path, rename_reason = get_unique_target_path(
+                    source_path,
+                    target_dir,
+                    platform_shortcode,
+                    source_folder_name,
+                    target_index[platform_shortcode],
+                    self.operations_logger,
+                    trusted_names.get(platform_shortcode)
+                )
+                
+                if rename_reason and rename_reason.startswith("skip_identical"):
+                    stats.files_skipped_duplicate += 1
+                elif rename_reason and rename_reason.startswith("renamed_"):
+                    stats.files_renamed_duplicates += 1
+                    if debug_enabled:
+                        log_debug("[DRY RUN] Would copy with rename: %s -> %s", source_path, target_file_path)
+                else:
+                    stats.files_copied += 1
+                    if debug_enabled:
+                        log_debug("[DRY RUN] Would copy: %s -> %s", source_path, target_file_path)
+            processed_files += len(folder_files)
+        
+        if self.show_progress:
+            display_unified_progress(
+                emoji="📦",
+                label="Processing",
+                current=processed_files,
+                total=total_files
+            )
+            print()  # Add newline after progress
+        return stats
+    
     def _calculate_progress_update_frequency(self, total_files: int) -> int:
         """Calculate appropriate progress update frequency based on file count"""
         if total_files < 1000:
@@ -1746,7 +2440,9 @@ class AsyncFileCopyEngine:
         import os
         
         stats = ProcessingStats()
-        total_files = sum(len(files) for files in files_by_folder.values())
+        total_files = sum(map(len, files_by_folder.values()))
+        target_index = self._prepare_target_dirs(files_by_folder, platforms, target_dir, stats)
+        trusted_names = self._trusted_target_names(target_index)
         
         self.operations_logger.info("Using single-threaded processing for WSL2 compatibility")
         self.operations_logger.info(f"Processing {total_files} files across {len(files_by_folder)} folders")
@@ -1755,33 +2451,33 @@ class AsyncFileCopyEngine:
         update_frequency = self._calculate_progress_update_frequency(total_files)
         
         # Chunked processing configuration for WSL2 stability
+        # Each copy is fdatasync'd individually, so chunks no longer need a system-wide sync
         chunk_size = 1000  # Process 1000 files at a time
-        recovery_pause = 5.0  # 5-second pause between chunks
+        recovery_pause = 1.0  # 1-second pause between chunks
         
         processed_files = 0
         start_time = time.perf_counter()
-        last_update_time = start_time
         last_chunk_time = start_time
         
-        # Track target paths globally to prevent collisions across chunks
-        global_target_paths = set()
-        
         # User feedback about processing mode
         print(f"📦 Starting WSL2-optimized chunked processing ({total_files:,} files)...", flush=True)
         self.operations_logger.info(f"Using chunked processing: {chunk_size} files per chunk with {recovery_pause}s recovery pauses")
         
         # Convert files to a flat list for chunked processing
-        all_files = []
-        for folder_path, files in files_by_folder.items():
-            for file_info in files:
-                all_files.append(file_info)
+        all_files = list(itertools.chain.from_iterable(files_by_folder.values()))
+        
+        # Bind per-file attribute lookups once outside the chunk loop
+        log_info = self.operations_logger.info
+        log_debug = self.operations_logger.debug
+        debug_enabled = self.operations_logger.isEnabledFor(logging.DEBUG)
+        copy_with_retry = self._copy_with_retry
         
         # Process files in chunks
         for chunk_start in range(0, len(all_files), chunk_size):
             chunk_end = min(chunk_start + chunk_size, len(all_files))
             chunk_files = all_files[chunk_start:chunk_end]
             
-            self.operations_logger.info(f"Processing chunk {chunk_start//chunk_size + 1}: files {chunk_start+1}-{chunk_end}")
+            log_info(f"Processing chunk {chunk_start//chunk_size + 1}: files {chunk_start+1}-{chunk_end}")
             
             # Process current chunk
             for file_info in chunk_files:
@@ -1797,17 +2493,16 @@ class AsyncFileCopyEngine:
                         target_dir,
                         platform_shortcode,
                         source_folder_name,
-                        global_target_paths,
-                        self.operations_logger
+                        target_index[platform_shortcode],
+                        self.operations_logger,
+                        trusted_names.get(platform_shortcode)
                     )
                     
-                    # Track this target path to prevent future collisions
-                    global_target_paths.add(str(target_file_path))
-                    
                     # Handle rename reasons
-                    if rename_reason == "skip_identical":
+                    if rename_reason and rename_reason.startswith("skip_identical"):
                         stats.files_skipped_duplicate += 1
-                        self.operations_logger.debug(f"Skipping truly identical file: {source_path.name}")
+                        if debug_enabled:
+                            log_debug("Skipping truly identical file: %s", source_path.name)
                         processed_files += 1
                         continue
                     elif rename_reason and rename_reason.startswith("renamed_"):
@@ -1815,17 +2510,17 @@ class AsyncFileCopyEngine:
                         # Log the rename decision
                         if "hint_" in rename_reason:
                             hint = rename_reason.split("hint_")[1]
-                            self.operations_logger.info(f"Prevented overwrite: {source_path.name} -> {target_file_path.name} (hint: {hint})")
+                            log_info("Prevented overwrite: %s -> %s (hint: %s)", source_path.name, target_file_path.name, hint)
                         elif "number_" in rename_reason:
                             number = rename_reason.split("number_")[1]
-                            self.operations_logger.info(f"Prevented overwrite: {source_path.name} -> {target_file_path.name} (#{number})")
+                            log_info("Prevented overwrite: %s -> %s (#%s)", source_path.name, target_file_path.name, number)
                     
                     # Update progress display with final filename
                     if update_progress_callback:
                         update_progress_callback(f"{platform_shortcode}/{target_file_path.name}")
                     
-                    # Perform copy with retry logic
-                    success = self._copy_with_retry(source_path, target_file_path)
+                    # Perform copy with retry logic, flushing each file instead of the whole OS
+                    success, _ = copy_with_retry(source_path, target_file_path, durable=True)
                     
                     if success:
                         stats.files_copied += 1
@@ -1834,10 +2529,9 @@ class AsyncFileCopyEngine:
                         
                 processed_files += 1
                 
-                # Progress update with unified display function
-                current_time = time.perf_counter()
+                # Progress update with unified display function (sample the clock only when drawing)
                 if processed_files % update_frequency == 0 or processed_files == total_files:
-                    elapsed_time = current_time - start_time
+                    elapsed_time = time.perf_counter() - start_time
                     
                     if elapsed_time > 0:
                         files_per_sec = processed_files / elapsed_time
@@ -1855,8 +2549,6 @@ class AsyncFileCopyEngine:
                         rate=files_per_sec,
                         eta_seconds=eta_seconds
                     )
-                    
-                    last_update_time = current_time
             
             # WSL2 Recovery pause between chunks (except for the last chunk)
             if chunk_end < len(all_files):
@@ -1866,12 +2558,6 @@ class AsyncFileCopyEngine:
                 print(f"\n⏸️  Recovery pause ({recovery_pause}s) - letting WSL2's 9p protocol recover...", flush=True)
                 self.operations_logger.info(f"Recovery pause: {recovery_pause}s to prevent 9p protocol saturation")
                 
-                # Perform filesystem sync to ensure all operations are committed
-                try:
-                    os.sync()
-                except:
-                    pass  # sync() may not be available on all systems
-                
                 time.sleep(recovery_pause)
                 last_chunk_time = time.perf_counter()
                 
@@ -1887,7 +2573,7 @@ class AsyncFileCopyEngine:
         import time
         from pathlib import Path
         from threading import Lock
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
         
         stats = ProcessingStats()
         
@@ -1918,44 +2604,41 @@ class AsyncFileCopyEngine:
                     'category': error_category
                 })
         
-        # Flatten files from folder structure and extract paths
-        all_files = []
-        for folder_files in files_by_folder.values():
-            for file_info in folder_files:
-                if isinstance(file_info, dict):
-                    all_files.append(file_info['path'])
-                else:
-                    all_files.append(file_info)
-            
-        stats.files_found = len(all_files)
+        # Only the file count is needed up front; each folder is planned inside its worker
+        total_files = sum(map(len, files_by_folder.values()))
+        stats.files_found = total_files
         
-        if not all_files:
+        if not total_files:
             return stats
             
         self.operations_logger.info(f"Using concurrent processing with {self.max_workers} workers")
-        self.operations_logger.info(f"Processing {len(all_files)} files across {len(files_by_folder)} folders")
+        self.operations_logger.info(f"Processing {total_files} files across {len(files_by_folder)} folders")
         
-        # Progress tracking variables (thread-safe)
+        # Create platform directories once before workers start (idempotent, O(platforms) not O(files))
+        target_index = self._prepare_target_dirs(files_by_folder, platforms, target_dir, stats)
+        trusted_names = self._trusted_target_names(target_index)
+        
+        # Progress tracking: workers keep per-folder tallies locally and return them,
+        # so the only shared per-file state is an itertools.count (atomic under the GIL).
+        # progress_lock now only serializes the occasional progress bar redraw.
         progress_lock = Lock()
-        files_processed = 0
+        processed_counter = itertools.count(1)
         files_copied = 0
         files_renamed = 0
         files_skipped = 0
         errors = 0
         start_time = time.perf_counter()
         
-        # Track target paths globally to prevent collisions across threads
-        global_target_paths = set()
+        # target_index holds one claimed-filename set per platform; guard check-and-claim across threads
         global_paths_lock = Lock()
         
-        def update_progress_threadsafe():
+        def update_progress_threadsafe(files_processed: int):
             """Thread-safe progress display"""
-            current_time = time.perf_counter()
-            elapsed_time = current_time - start_time
+            elapsed_time = time.perf_counter() - start_time
             
             if elapsed_time > 0 and files_processed > 0:
                 files_per_sec = files_processed / elapsed_time
-                estimated_total_time = (len(all_files) * elapsed_time) / files_processed
+                estimated_total_time = (total_files * elapsed_time) / files_processed
                 eta_seconds = max(0, estimated_total_time - elapsed_time)
             else:
                 files_per_sec = 0
@@ -1966,192 +2649,286 @@ class AsyncFileCopyEngine:
                 emoji="📦",
                 label="Processing", 
                 current=files_processed,
-                total=len(all_files),
+                total=total_files,
                 rate=files_per_sec,
                 eta_seconds=eta_seconds
             )
         
         def process_folder_files(folder_path, folder_files):
-            """Process all files from a single folder sequentially"""
-            nonlocal files_processed, files_copied, files_renamed, files_skipped, errors
+            """Process all files from a single folder sequentially
+            
+            Returns (copied, renamed, skipped, errors) tallies for this folder,
+            which the main thread sums once the future completes.
+            """
             folder_copied = 0
             folder_renamed = 0
             folder_skipped = 0 
             folder_errors = 0
             
-            self.operations_logger.info(f"Processing folder: {folder_path} with {len(folder_files)} files")
+            # Bind per-file attribute lookups once; this loop runs for every file in the collection
+            log_info = self.operations_logger.info
+            log_debug = self.operations_logger.debug
+            debug_enabled = self.operations_logger.isEnabledFor(logging.DEBUG)
+            log_error = self.errors_logger.error
+            copy_with_retry = self._copy_with_retry
+            show_progress = self.show_progress
+            check_shutdown = self.shutdown_handler.check_shutdown if self.shutdown_handler else None
+            
+            log_info(f"Processing folder: {folder_path} with {len(folder_files)} files")
+            
+            # Resolve paths and platforms for the whole folder before the per-file loop
+            plan = self._plan_folder_files(folder_files, platforms, target_dir)
             
             file_count = 0
-            for file_info in folder_files:
+            for source_path, platform_shortcode, source_folder_name in plan:
                 # Check for shutdown every 10 files
                 if file_count % 10 == 0:
-                    if self.shutdown_handler and self.shutdown_handler.check_shutdown():
-                        self.operations_logger.info(f"Shutdown requested, stopping folder processing at file {file_count}")
+                    if check_shutdown and check_shutdown():
+                        log_info(f"Shutdown requested, stopping folder processing at file {file_count}")
                         break
                 
                 file_count += 1
                 try:
-                    # Handle dict structure from _group_files_by_folder
-                    if isinstance(file_info, dict):
-                        source_path = Path(file_info['path'])
-                        platform_shortcode = file_info['platform']
-                        source_folder_name = source_path.parent.name
-                    else:
-                        source_path = Path(file_info)
-                        platform_shortcode = None
-                        source_folder_name = None
-                    
-                    # If platform wasn't found in dict, fall back to detection logic
-                    if not platform_shortcode and platforms:
-                        # Find which platform this file belongs to
-                        for platform_code, platform_info in platforms.items():
-                            for source_folder in platform_info.source_folders:
-                                # Use the file's parent directory to match platform
-                                try:
-                                    if str(source_path.parent).endswith(source_folder) or source_folder in str(source_path):
-                                        platform_shortcode = platform_code
-                                        source_folder_name = source_folder
-                                        break
-                                except ValueError:
-                                    continue
-                            if platform_shortcode:
-                                break
-                    
-                    if not platform_shortcode:
-                        platform_shortcode = source_path.parent.name.lower()
-                        source_folder_name = source_path.parent.name
-                    
-                    # Thread-safe duplicate handling with SHA1 verification
+                    # Thread-safe duplicate handling with SHA1 verification: the lock covers
+                    # only the check-and-claim steps, collision hashing runs unlocked
                     with global_paths_lock:
-                        target_file_path, rename_reason = get_unique_target_path(
-                            source_path,
-                            target_dir,
-                            platform_shortcode,
-                            source_folder_name,
-                            global_target_paths,
-                            self.operations_logger
-                        )
-                        # Only add to tracking if not skipping identical file
-                        if rename_reason != "skip_identical":
-                            global_target_paths.add(str(target_file_path))
-                    
-                    # Create target directory if needed
-                    target_file_path.parent.mkdir(parents=True, exist_ok=True)
+                        if platform_shortcode not in target_index:
+                            # Fallback platforms from plain path entries were not prefetched
+                            target_index.update(build_target_index(target_dir, [platform_shortcode]))
+                        claimed_names = target_index[platform_shortcode]
+                    target_file_path, rename_reason = get_unique_target_path(
+                        source_path,
+                        target_dir,
+                        platform_shortcode,
+                        source_folder_name,
+                        claimed_names,
+                        self.operations_logger,
+                        trusted_names.get(platform_shortcode),
+                        claim_lock=global_paths_lock
+                    )
                     
                     # Handle file based on duplicate analysis result
-                    if rename_reason == "skip_identical":
-                        # TRUE DUPLICATE: Same filename AND same SHA1 checksum
+                    if rename_reason and rename_reason.startswith("skip_identical"):
+                        # TRUE DUPLICATE: Same filename AND same SHA1 checksum (or, for
+                        # skip_identical_metadata, same size/mtime/samples as an already-hashed target)
                         folder_skipped += 1
-                        self.operations_logger.info(f"Skipping identical file (SHA1 match): {source_path.name}")
+                        if rename_reason == "skip_identical_metadata":
+                            log_info("Skipping identical file (SHA1 match, cached target digest): %s",
+                                     source_path.name)
+                        else:
+                            log_info("Skipping identical file (SHA1 match): %s", source_path.name)
                         
                     elif rename_reason and rename_reason.startswith("renamed_"):
                         # COLLISION: Same filename but DIFFERENT content
-                        if not self.dry_run:
-                            success, copy_info = self._copy_with_retry(source_path, target_file_path)
-                            if success:
-                                folder_renamed += 1  # Track as renamed, not copied
-                                if "hint" in rename_reason:
-                                    hint = rename_reason.split("_")[-1]
-                                    self.operations_logger.info(f"Renamed with folder hint: {source_path.name} -> {target_file_path.name} (hint: {hint})")
-                                else:
-                                    self.operations_logger.info(f"Renamed with number: {source_path.name} -> {target_file_path.name}")
+                        success, copy_info = copy_with_retry(source_path, target_file_path)
+                        if success:
+                            folder_renamed += 1  # Track as renamed, not copied
+                            if "hint" in rename_reason:
+                                hint = rename_reason.split("_")[-1]
+                                log_info("Renamed with folder hint: %s -> %s (hint: %s)", source_path.name, target_file_path.name, hint)
                             else:
-                                folder_errors += 1
-                                error_msg = f"Copy failed after retries: {copy_info}"
-                                self.errors_logger.error(f"Failed to copy renamed file: {source_path.name} - {copy_info}")
-                                add_error_detail(str(source_path), error_msg)
+                                log_info("Renamed with number: %s -> %s", source_path.name, target_file_path.name)
                         else:
-                            # Dry run mode - renamed file
-                            folder_renamed += 1
-                            self.operations_logger.debug(f"[DRY RUN] Would copy with rename: {source_path} -> {target_file_path}")
+                            folder_errors += 1
+                            error_msg = f"Copy failed after retries: {copy_info}"
+                            log_error("Failed to copy renamed file: %s - %s", source_path.name, copy_info)
+                            add_error_detail(str(source_path), error_msg)
                             
                     else:
                         # UNIQUE FILE: No collision, normal copy
-                        if not self.dry_run:
-                            success, copy_info = self._copy_with_retry(source_path, target_file_path)
-                            if success:
-                                folder_copied += 1
-                                self.operations_logger.debug(f"Successfully copied: {source_path} -> {target_file_path}")
-                            else:
-                                folder_errors += 1
-                                error_msg = f"Copy failed after retries: {copy_info}"
-                                self.errors_logger.error(f"Failed to copy: {source_path.name} - {copy_info}")
-                                add_error_detail(str(source_path), error_msg)
-                        else:
-                            # Dry run mode - normal copy
+                        success, copy_info = copy_with_retry(source_path, target_file_path)
+                        if success:
                             folder_copied += 1
-                            self.operations_logger.debug(f"[DRY RUN] Would copy: {source_path} -> {target_file_path}")
+                            if debug_enabled:
+                                log_debug("Successfully copied: %s -> %s", source_path, target_file_path)
+                        else:
+                            folder_errors += 1
+                            error_msg = f"Copy failed after retries: {copy_info}"
+                            log_error("Failed to copy: %s - %s", source_path.name, copy_info)
+                            add_error_detail(str(source_path), error_msg)
                         
                 except Exception as e:
                     folder_errors += 1
                     error_msg = f"Exception processing file: {str(e)}"
-                    self.errors_logger.error(f"Error processing {source_path}: {error_msg}")
+                    log_error("Error processing %s: %s", source_path, error_msg)
                     add_error_detail(str(source_path), error_msg)
                 
                 finally:
-                    # Update global counters thread-safely
-                    with progress_lock:
-                        files_processed += 1
-                        if files_processed % 50 == 0:  # Update progress every 50 files
-                            update_progress_threadsafe()
-                            
-            # Update global stats for this folder
-            with progress_lock:
-                files_copied += folder_copied
-                files_renamed += folder_renamed
-                files_skipped += folder_skipped
-                errors += folder_errors
+                    # Lock-free increment; only take the lock to redraw the progress bar
+                    processed_so_far = next(processed_counter)
+                    if show_progress and processed_so_far % 50 == 0:  # Update progress every 50 files
+                        with progress_lock:
+                            update_progress_threadsafe(processed_so_far)
+            
+            return folder_copied, folder_renamed, folder_skipped, folder_errors
         
         # Process folders concurrently
-        with ThreadPoolExecutor(max_workers=min(len(files_by_folder), self.max_workers)) as executor:
-            # Submit all folder processing tasks
+        pool_kwargs = {}
+        if self.pin_threads and hasattr(os, 'sched_getaffinity'):
+            allowed_cpus = sorted(os.sched_getaffinity(0))
+            if len(allowed_cpus) > 1:
+                # Spread workers round-robin over the cores this process may use
+                pool_kwargs = {'initializer': _pin_copy_thread,
+                               'initargs': (itertools.cycle(allowed_cpus),)}
+        with ThreadPoolExecutor(max_workers=min(len(files_by_folder), self.max_workers),
+                                **pool_kwargs) as executor:
+            # Keep only a bounded window of folders in flight instead of one Future per folder
+            folder_iter = iter(files_by_folder.items())
+            max_inflight = 2 * self.max_workers
             future_to_folder = {}
-            for folder_path, folder_files in files_by_folder.items():
-                future = executor.submit(process_folder_files, folder_path, folder_files)
-                future_to_folder[future] = folder_path
             
-            # Wait for completion and handle any exceptions
-            for future in as_completed(future_to_folder):
-                folder_path = future_to_folder[future]
+            def submit_next() -> bool:
+                next_item = next(folder_iter, None)
+                if next_item is None:
+                    return False
+                folder_path, folder_files = next_item
+                future_to_folder[executor.submit(process_folder_files, folder_path, folder_files)] = folder_path
+                return True
+            
+            while len(future_to_folder) < max_inflight and submit_next():
+                pass
+            
+            shutdown_requested = False
+            while future_to_folder:
+                done, _ = wait(future_to_folder, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder_path = future_to_folder.pop(future)
+                    if future.cancelled():
+                        continue
+                    # Merge per-folder tallies here; only this thread touches the totals
+                    try:
+                        folder_copied, folder_renamed, folder_skipped, folder_errors = future.result()
+                    except Exception as e:
+                        errors += 1
+                        error_msg = f"Thread exception processing folder {folder_path}: {str(e)}"
+                        self.errors_logger.error(error_msg)
+                        add_error_detail(str(folder_path), error_msg, "thread_exception")
+                        continue
+                    files_copied += folder_copied
+                    files_renamed += folder_renamed
+                    files_skipped += folder_skipped
+                    errors += folder_errors
                 
-                # Check for shutdown after each folder completes
-                if self.shutdown_handler and self.shutdown_handler.check_shutdown():
+                # Check for shutdown after each batch of folders completes
+                if not shutdown_requested and self.shutdown_handler and self.shutdown_handler.check_shutdown():
                     self.operations_logger.info("Shutdown requested, canceling remaining folder processing")
-                    # Cancel remaining futures
+                    shutdown_requested = True
+                    # Cancel queued futures; running ones finish and are still merged
                     for remaining_future in future_to_folder:
-                        if not remaining_future.done():
-                            remaining_future.cancel()
-                    break
+                        remaining_future.cancel()
+                
+                if not shutdown_requested:
+                    for _ in range(len(done)):
+                        if not submit_next():
+                            break
+        
+        # Final progress update (counter was pre-advanced once per processed file)
+        files_processed = next(processed_counter) - 1
+        stats.files_copied = files_copied
+        stats.files_renamed_duplicates = files_renamed
+        stats.files_skipped_duplicate = files_skipped
+        stats.errors = errors
+        
+        if self.show_progress:
+            update_progress_threadsafe(files_processed)
+            print()  # Add newline after progress
+        return stats
+    
+    def _process_multiprocess(self, files_by_folder, platforms, target_dir) -> ProcessingStats:
+        """Process platform shards in separate worker processes to sidestep the GIL
+        
+        Files are sharded by target platform so duplicate-name tracking, which is
+        per platform directory, never has to cross a process boundary. Each worker
+        runs the normal concurrent strategy on its shard with a share of the threads.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        stats = ProcessingStats()
+        
+        # Shard by platform: {platform: {folder_path: [file_info, ...]}}
+        shards = defaultdict(lambda: defaultdict(list))
+        for folder_path, folder_files in files_by_folder.items():
+            for file_info in folder_files:
+                shards[file_info['platform']][folder_path].append(file_info)
+        
+        total_files = sum(map(len, files_by_folder.values()))
+        processes = min(self.processes, len(shards)) or 1
+        threads_per_process = max(1, self.max_workers // processes)
+        log_files = {}
+        for name, logger in (('operations', self.operations_logger),
+                             ('errors', self.errors_logger),
+                             ('progress', self.progress_logger)):
+            for handler in logger.handlers:
+                # Write out buffered records first so worker lines land after them in the file
+                handler.flush()
+                file_handler = log_file_handler(handler)
+                if hasattr(file_handler, 'baseFilename'):
+                    log_files.setdefault(name, file_handler.baseFilename)
+        
+        self.operations_logger.info(f"Using multi-process copying: {len(shards)} platform shards across "
+                                    f"{processes} processes x {threads_per_process} threads")
+        
+        files_done = 0
+        # spawn gives identical behavior on Linux, macOS and Windows
+        with ProcessPoolExecutor(max_workers=processes,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_copy_worker,
+                                 initargs=(log_files, self.operations_logger.level,
+                                           str(_hash_cache.db_path) if _hash_cache else None)) as executor:
+            future_to_platform = {
+                executor.submit(_copy_platform_shard, dict(shard), platforms, target_dir,
+                                self.dry_run, threads_per_process, self.paranoid_hash,
+                                self.skip_identical): platform
+                for platform, shard in shards.items()
+            }
+            
+            for future in as_completed(future_to_platform):
+                platform = future_to_platform[future]
+                shard_files = sum(len(files) for files in shards[platform].values())
+                files_done += shard_files
                 
                 try:
-                    future.result()  # This will raise any exception that occurred
+                    stats.merge(future.result())
                 except Exception as e:
-                    with progress_lock:
-                        errors += 1
-                    error_msg = f"Thread exception processing folder {folder_path}: {str(e)}"
+                    stats.errors += shard_files
+                    error_msg = f"Worker process exception processing platform {platform}: {str(e)}"
                     self.errors_logger.error(error_msg)
-                    add_error_detail(str(folder_path), error_msg, "thread_exception")
-        
-        # Final progress update
-        with progress_lock:
-            update_progress_threadsafe()
-            stats.files_copied = files_copied
-            stats.files_renamed_duplicates = files_renamed
-            stats.files_skipped_duplicate = files_skipped
-            stats.errors = errors
+                    stats.error_details.append({
+                        'file_path': platform,
+                        'error_message': error_msg,
+                        'category': 'thread_exception'
+                    })
+                
+                display_unified_progress(
+                    emoji="📦",
+                    label="Processing",
+                    current=files_done,
+                    total=total_files,
+                    extra_info=f"{platform} done"
+                )
+                
+                if self.shutdown_handler and self.shutdown_handler.check_shutdown():
+                    self.operations_logger.info("Shutdown requested, canceling remaining platform shards")
+                    for remaining_future in future_to_platform:
+                        remaining_future.cancel()
+                    break
         
         print()  # Add newline after progress
         return stats
     
-    def _copy_with_retry(self, source_path: Path, target_path: Path, max_retries: int = 3) -> tuple[bool, str]:
-        """Copy file with retry logic avoiding temp files to prevent antivirus interference"""
+    def _copy_with_retry(self, source_path: Path, target_path: Path, max_retries: int = 3,
+                         durable: bool = False) -> tuple[bool, str]:
+        """Copy file with retry logic avoiding temp files to prevent antivirus interference
         
-        # Ensure target directory exists
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        Target platform directories are created up front by _prepare_target_dirs.
+        durable=True fdatasyncs each copied file (used by the WSL2 single-threaded path).
+        """
         
         for attempt in range(max_retries):
             # Use the new CRC-based verification method
-            success, info = copy_file_with_verification(source_path, target_path, self.operations_logger)
+            success, info = copy_file_with_verification(source_path, target_path, self.operations_logger,
+                                                        create_parent=False, durable=durable)
             
             if success:
                 return True, info
@@ -2179,7 +2956,14 @@ class AsyncFileCopyEngine:
         total_platforms = len(selected_platforms)
         processed_platforms = 0
         start_time = time.perf_counter()
-        last_update_time = time.perf_counter()  # Track last progress update separately
+        last_update_time = start_time  # Track last progress update separately
+        
+        # Walk every selected source folder up front (in parallel); results come back in folder order
+        folder_paths = [source_dir / source_folder
+                        for platform_shortcode in selected_platforms if platform_shortcode in platforms
+                        for source_folder in platforms[platform_shortcode].source_folders]
+        serial = len(folder_paths) < 2 or is_wsl2_mount(Path(source_dir).resolve())
+        folder_scans = map_directory_scans(scan_rom_files, folder_paths, serial)
         
         for platform_shortcode in selected_platforms:
             if platform_shortcode in platforms:
@@ -2189,20 +2973,12 @@ class AsyncFileCopyEngine:
                 total_folders = len(platform_info.source_folders)
                 processed_folders = 0
                 
-                for source_folder in platform_info.source_folders:
-                    folder_path = source_dir / source_folder
-                    if folder_path.exists():
-                        # Count ALL files for complete statistics
-                        for file_path in folder_path.rglob("*"):
-                            if file_path.is_file():
-                                total_files_discovered += 1
-                                extension = file_path.suffix.lower()
-                                # Only add ROM files to processing list
-                                if extension in ROM_EXTENSIONS:
-                                    files.append(file_path)
-                                else:
-                                    # Track non-ROM file extensions for transparency
-                                    non_rom_extensions[extension] += 1
+                for _ in platform_info.source_folders:
+                    # Count ALL files for complete statistics; only ROM files are processed
+                    folder_files, folder_other_extensions = next(folder_scans)
+                    files.extend(folder_files)
+                    non_rom_extensions.update(folder_other_extensions)
+                    total_files_discovered += len(folder_files) + sum(folder_other_extensions.values())
                     
                     processed_folders += 1
                     
@@ -2283,16 +3059,11 @@ class AsyncFileCopyEngine:
         if not target_dir.exists():
             return 0, [f"Target directory does not exist: {target_dir}"]
         
-        actual_files = []
         discrepancy_details = []
         
         try:
-            # Count actual ROM files in target directory
-            for file_path in target_dir.rglob("*"):
-                if file_path.is_file() and file_path.suffix.lower() in ROM_EXTENSIONS:
-                    actual_files.append(file_path)
-            
-            actual_count = len(actual_files)
+            # Count actual ROM files in target directory (scandir walk, no stat per file)
+            actual_count = count_rom_files_in_directory(target_dir)
             
             # Check for count mismatch
             if actual_count != expected_count:
@@ -2318,6 +3089,48 @@ class AsyncFileCopyEngine:
             self.errors_logger.error(f"CRITICAL: Target file validation failed: {str(e)}")
             return 0, discrepancy_details
 
+def _pin_copy_thread(cpus) -> None:
+    """Thread-pool initializer: pin the calling worker thread to the next CPU (Linux only)"""
+    try:
+        os.sched_setaffinity(0, {next(cpus)})
+    except OSError:
+        pass  # Affinity is an optimization; an unpinned worker still copies correctly
+
+def _init_copy_worker(log_files: Dict[str, str], level: int, hash_cache_path: Optional[str] = None) -> None:
+    """Process-pool initializer: reopen the parent's log files and hash cache, leave Ctrl+C to the parent"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hash_cache_path:
+        open_hash_cache(Path(hash_cache_path), logger=logging.getLogger('errors'))
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    for log_type, log_file in log_files.items():
+        logger = logging.getLogger(log_type)
+        logger.setLevel(level)
+        handler = SafeFileHandler(log_file, encoding='utf-8')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+def _copy_platform_shard(shard_files_by_folder, platforms, target_dir: Path, dry_run: bool,
+                         max_workers: int, paranoid_hash: bool = False,
+                         skip_identical: bool = True) -> ProcessingStats:
+    """Worker-process entry point: copy one platform shard with the concurrent strategy"""
+    engine = AsyncFileCopyEngine(
+        logging.getLogger('operations'),
+        logging.getLogger('errors'),
+        logging.getLogger('progress'),
+        dry_run,
+        paranoid_hash=paranoid_hash,
+        skip_identical=skip_identical
+    )  # No pin_threads: every shard would cycle over the same first cores
+    engine.max_workers = max_workers
+    engine.show_progress = False
+    try:
+        return engine._process_concurrent(shard_files_by_folder, platforms, target_dir, None)
+    finally:
+        # Pool workers exit without running atexit hooks
+        if _hash_cache is not None:
+            _hash_cache.flush()
+
 class PlatformAnalyzer:
     """Analyzes directories and identifies platforms"""
     
@@ -2339,6 +3152,19 @@ class PlatformAnalyzer:
         # Initialize performance monitor for optimization tracking
         self.performance_monitor = PerformanceMonitor(self.logger)
         
+        # All PLATFORM_MAPPINGS patterns as one alternation: a single match() call finds the
+        # first pattern (in dict order) that matches, and lastgroup names its index
+        self._platform_entries = list(PLATFORM_MAPPINGS.items())
+        self._platform_matcher = re.compile(
+            '|'.join(f'(?P<p{index}>{pattern})' for index, (pattern, _) in enumerate(self._platform_entries)),
+            re.IGNORECASE
+        )
+        # Preprocessed folder name -> (pattern_index, final_platform, final_display_name) or None;
+        # regex and regional lookups are pure for a given analyzer, so repeats skip both
+        self._platform_match_cache: Dict[str, Optional[Tuple[int, str, str]]] = {}
+        # Folder name -> exclusion reason or None (the exclusion alternation is fixed at import)
+        self._exclusion_cache: Dict[str, Optional[str]] = {}
+        
     def analyze_directory(self, debug_mode: bool = False, include_empty_dirs: bool = False, target_dir: Path = None) -> Tuple[Dict[str, PlatformInfo], Dict[str, Tuple[str, int]], List[str], Dict[str, int]]:
         """
         Analyze source directory and categorize all content
@@ -2386,10 +3212,14 @@ class PlatformAnalyzer:
         
         # First, get all top-level directories
         top_level_dirs = []
+        top_level_symlinks = set()
         try:
-            for item in source_path.iterdir():
-                if item.is_dir():
-                    top_level_dirs.append(item)
+            with os.scandir(source_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        top_level_dirs.append(Path(entry.path))
+                        if entry.is_symlink():
+                            top_level_symlinks.add(entry.name)
         except (OSError, PermissionError) as e:
             self.logger.error(f"Error accessing source directory: {e}")
             directory_stats = {
@@ -2399,6 +3229,34 @@ class PlatformAnalyzer:
             }
             return platforms, excluded, unknown, directory_stats
         
+        # Skip target directory to avoid loops (precise path comparison). Both roots are resolved once:
+        # a plain child is the target only if the target sits directly in source_dir under the same
+        # name, and a symlinked child is compared by one stat() against the target's identity
+        target_resolved = target_dir.resolve() if target_dir else None
+        target_name_in_source = (target_resolved.name if target_resolved is not None
+                                 and target_resolved.parent == source_path.resolve() else None)
+        target_stat = None
+        if target_resolved is not None and top_level_symlinks:
+            try:
+                target_stat = os.stat(target_resolved)
+            except OSError:
+                pass  # Target not created yet, so no symlink can point at it
+        
+        def is_target(platform_dir: Path) -> bool:
+            if platform_dir.name in top_level_symlinks:
+                try:
+                    return target_stat is not None and os.path.samestat(os.stat(platform_dir), target_stat)
+                except OSError:
+                    return False
+            return platform_dir.name == target_name_in_source
+        
+        is_target_dir = [is_target(platform_dir) for platform_dir in top_level_dirs]
+        
+        # Walk the platform directories ahead of this loop (concurrently where safe); results arrive in order
+        dir_scans = self._scan_directories([
+            platform_dir for platform_dir, is_target in zip(top_level_dirs, is_target_dir) if not is_target
+        ])
+        
         # Process each top-level directory and count ROM files recursively within each
         total_dirs = len(top_level_dirs)
         for idx, platform_dir in enumerate(top_level_dirs):
@@ -2407,36 +3265,27 @@ class PlatformAnalyzer:
             if debug_mode:
                 self.logger.debug(f"Processing top-level directory: {platform_dir}")
             
-            # Skip target directory to avoid loops (precise path comparison)
-            if target_dir and platform_dir.resolve() == target_dir.resolve():
+            if is_target_dir[idx]:
                 directories_skipped_target += 1
                 if debug_mode:
                     self.logger.debug(f"  Skipped: Target directory (exact match): {platform_dir}")
                 continue
                 
-            # Count ROM files recursively within this platform directory
-            rom_files = []
-            all_extensions = set()
-            
-            for root, dirs, files in os.walk(platform_dir):
-                for file in files:
-                    extension = Path(file).suffix.lower()
-                    all_extensions.add(extension)
-                    # Track all files for global transparency
-                    all_file_extensions[extension] += 1
-                    total_files_analyzed += 1
-                    
-                    if extension in ROM_EXTENSIONS:
-                        rom_files.append(file)
+            # Count ROM files recursively within this platform directory; only the
+            # per-directory extension Counter is kept, ROM count and debug detail derive from it
+            dir_extensions = next(dir_scans)
+            all_file_extensions.update(dir_extensions)
+            total_files_analyzed += sum(dir_extensions.values())
+            rom_file_count = sum(count for extension, count in dir_extensions.items() if extension in ROM_EXTENSIONS)
             
-            if not rom_files and not include_empty_dirs:
+            if not rom_file_count and not include_empty_dirs:
                 directories_skipped_roms += 1
                 if debug_mode:
-                    self.logger.debug(f"  Skipped: No ROM files (extensions: {sorted(all_extensions)})")
+                    self.logger.debug(f"  Skipped: No ROM files (extensions: {sorted(dir_extensions)})")
                 continue
             
             # Count directories with ROM files for progress reporting
-            if rom_files:
+            if rom_file_count:
                 directories_with_roms += 1
                 
             folder_name = platform_dir.name
@@ -2447,13 +3296,7 @@ class PlatformAnalyzer:
             # Check for exclusions first
             exclusion_reason = self._check_exclusions(folder_name)
             if exclusion_reason:
-                # Validation: ensure we store integer count, not list
-                file_count = len(rom_files)
-                if debug_mode and not isinstance(file_count, int):
-                    self.logger.error(f"ERROR: len(rom_files) returned {type(file_count)}, not int: {file_count}")
-                if debug_mode and not isinstance(rom_files, list):
-                    self.logger.error(f"ERROR: rom_files is {type(rom_files)}, not list: {rom_files}")
-                
+                file_count = rom_file_count
                 excluded[folder_name] = (exclusion_reason, file_count)
                 progress_display.stats['excluded'] = len(excluded)
                 if debug_mode:
@@ -2471,24 +3314,15 @@ class PlatformAnalyzer:
                 if debug_mode:
                     self.logger.debug(f"  [OK] Platform identified: {shortcode} ({display_name})")
                 
-                if shortcode not in platforms:
-                    platforms[shortcode] = PlatformInfo(
-                        shortcode=shortcode,
-                        display_name=display_name,
-                        folder_count=0,
-                        file_count=0,
-                        source_folders=[]
-                    )
+                platform_info = platforms.get(shortcode)
+                if platform_info is None:
+                    platform_info = platforms[shortcode] = PlatformInfo(shortcode=shortcode, display_name=display_name)
                 
-                # Update platform info
-                current = platforms[shortcode]
-                platforms[shortcode] = PlatformInfo(
-                    shortcode=current.shortcode,
-                    display_name=current.display_name,
-                    folder_count=current.folder_count + 1,
-                    file_count=current.file_count + len(rom_files),
-                    source_folders=current.source_folders + [str(platform_dir.relative_to(self.source_dir))]
-                )
+                # Update platform info in place
+                platform_info.folder_count += 1
+                platform_info.file_count += rom_file_count
+                # Top-level entries are direct children, so the path relative to source_dir is the name
+                platform_info.source_folders.append(folder_name)
                 progress_display.stats['analyzed'] = len(platforms)
             else:
                 unknown.append(folder_name)
@@ -2497,11 +3331,15 @@ class PlatformAnalyzer:
                     self.logger.debug(f"  [X] No platform match found")
             
             # Analysis progress removed - "Analysis complete" line is sufficient
-        print(f"✅ Analysis complete: {directories_with_roms} directories with ROM files, {len(platforms)} platforms identified")
-        print(f"📊 Platform Summary: ✅ {len(platforms)} platforms, ⚠️ {len(excluded)} excluded, ❓ {len(unknown)} unknown")
+        summary_lines = [
+            f"✅ Analysis complete: {directories_with_roms} directories with ROM files, {len(platforms)} platforms identified",
+            f"📊 Platform Summary: ✅ {len(platforms)} platforms, ⚠️ {len(excluded)} excluded, ❓ {len(unknown)} unknown",
+        ]
         if directories_skipped_roms > 0 or directories_skipped_target > 0:
             empty_note = " (including root source directory)" if directories_skipped_roms == 1 else ""
-            print(f"📊 Filtered: {directories_skipped_roms} empty dirs{empty_note}, {directories_skipped_target} target dirs skipped")
+            summary_lines.append(f"📊 Filtered: {directories_skipped_roms} empty dirs{empty_note}, {directories_skipped_target} target dirs skipped")
+        sys.stdout.write("\n".join(summary_lines) + "\n")
+        sys.stdout.flush()
         
         # Log detailed summary statistics
         if debug_mode:
@@ -2555,17 +3393,25 @@ class PlatformAnalyzer:
                 
         return platforms, excluded, unknown, directory_stats
     
+    def _scan_directories(self, directories: List[Path]):
+        """Yield count_file_extensions() for each directory, in order (see map_directory_scans)"""
+        serial = len(directories) < 2 or is_wsl2_mount(Path(self.source_dir).resolve())
+        return map_directory_scans(count_file_extensions, directories, serial)
+    
     def _check_exclusions(self, folder_name: str) -> Optional[str]:
         """Check if folder should be excluded"""
-        for pattern, reason in EXCLUDED_PLATFORMS.items():
-            if re.match(pattern, folder_name, re.IGNORECASE):
-                return reason
-        return None
+        if folder_name in self._exclusion_cache:
+            return self._exclusion_cache[folder_name]
+        exclusion_match = _EXCLUSION_MATCHER.match(folder_name)
+        reason = _EXCLUSION_REASONS[int(exclusion_match.lastgroup[1:])] if exclusion_match else None
+        self._exclusion_cache[folder_name] = reason
+        return reason
     
     def _identify_platform(self, folder_name: str, debug_mode: bool = False) -> Optional[Tuple[str, str]]:
         """Identify platform from folder name using specialized and regex patterns with regional preferences"""
         original_folder_name = folder_name
-        start_time = time.perf_counter()
+        # Timing is diagnostic only; skip the clock reads and list growth outside debug runs
+        start_time = time.perf_counter() if debug_mode else None
         
         try:
             if debug_mode:
@@ -2573,9 +3419,7 @@ class PlatformAnalyzer:
             
             # STEP 1: Try specialized patterns first (Good tools, MAME, FinalBurn Neo)
             # These have higher confidence and should be prioritized
-            specialized_start = time.perf_counter()
             specialized_result, specialized_context = self.specialized_processor.process(folder_name)
-            specialized_time = time.perf_counter() - specialized_start
             
             if debug_mode:
                 self.logger.debug(f"    STEP 1: Specialized patterns - {'[OK] Match' if specialized_result else '[X] No match'}")
@@ -2608,6 +3452,13 @@ class PlatformAnalyzer:
                 
                 return final_platform, final_display_name
             
+            # Metadata and hidden folders: reject before preprocessing and the mapping regex
+            if folder_name.startswith('.') or folder_name.lower() in NON_PLATFORM_FOLDERS:
+                if debug_mode:
+                    self.logger.debug(f"    [X] Non-platform system folder, skipping pattern matching")
+                self.performance_monitor.record_cache_miss("platform_identification")
+                return None
+            
             # STEP 2: Apply subcategory preprocessing if enabled
             if debug_mode:
                 self.logger.debug(f"    STEP 2: Subcategory preprocessing - {'Enabled' if self.subcategory_processor else 'Disabled'}")
@@ -2631,50 +3482,67 @@ class PlatformAnalyzer:
             if debug_mode:
                 self.logger.debug(f"    STEP 3: Testing {len(PLATFORM_MAPPINGS)} regex patterns against: '{folder_name}'")
             
-            regex_start = time.perf_counter()
-            patterns_tested = 0
+            if folder_name in self._platform_match_cache:
+                self.performance_monitor.record_cache_hit("platform_mapping")
+                mapping_result = self._platform_match_cache[folder_name]
+            else:
+                self.performance_monitor.record_cache_miss("platform_mapping")
+                mapping_result = self._platform_match_cache[folder_name] = self._resolve_platform_mapping(folder_name)
             
-            for pattern_index, (pattern, (shortcode, display_name)) in enumerate(PLATFORM_MAPPINGS.items()):
-                patterns_tested += 1
-                if debug_mode and patterns_tested <= 5:  # Show first 5 pattern attempts
-                    self.logger.debug(f"    Testing pattern {pattern_index}: {pattern}")
+            if mapping_result:
+                pattern_index, final_platform, final_display_name = mapping_result
+                pattern, (shortcode, display_name) = self._platform_entries[pattern_index]
                 
-                if re.match(pattern, folder_name, re.IGNORECASE):
-                    # Apply regional preference logic
-                    final_platform = self.regional_engine.get_target_platform(folder_name, shortcode)
-                    final_display_name = self.regional_engine.get_display_name(final_platform)
-                    
-                    # Record performance metrics
-                    self.performance_monitor.record_pattern_hit("regular_pattern", f"{shortcode}:{pattern_index}")
-                    
-                    # Log regular pattern matching
+                # Record performance metrics
+                self.performance_monitor.record_pattern_hit("regular_pattern", f"{shortcode}:{pattern_index}")
+                
+                # Log regular pattern matching
+                if debug_mode:
+                    self.logger.debug(f"    [OK] Pattern match #{pattern_index}: '{folder_name}' -> {shortcode} ({display_name})")
+                    self.logger.debug(f"    Matching pattern: {pattern}")
+                self.logger.debug(f"Regular pattern matched: '{folder_name}' -> {shortcode} ({display_name}) [Pattern: {pattern}]")
+                
+                # Log regional mapping decisions
+                if final_platform != shortcode:
                     if debug_mode:
-                        self.logger.debug(f"    [OK] Pattern match #{pattern_index}: '{folder_name}' -> {shortcode} ({display_name})")
-                        self.logger.debug(f"    Matching pattern: {pattern}")
-                    self.logger.debug(f"Regular pattern matched: '{folder_name}' -> {shortcode} ({display_name}) [Pattern: {pattern}]")
-                    
-                    # Log regional mapping decisions
-                    if final_platform != shortcode:
-                        if debug_mode:
-                            self.logger.debug(f"    Regional mapping: {shortcode} -> {final_platform}")
-                        self.logger.info(f"Regional mapping applied: {folder_name}")
-                        self.logger.info(f"  Original: {shortcode} ({display_name})")
-                        self.logger.info(f"  Final: {final_platform} ({final_display_name})")
-                        self.logger.info(f"  Mode: {self.regional_engine.regional_mode}")
-                    
-                    return final_platform, final_display_name
-            
+                        self.logger.debug(f"    Regional mapping: {shortcode} -> {final_platform}")
+                    self.logger.info(f"Regional mapping applied: {folder_name}")
+                    self.logger.info(f"  Original: {shortcode} ({display_name})")
+                    self.logger.info(f"  Final: {final_platform} ({final_display_name})")
+                    self.logger.info(f"  Mode: {self.regional_engine.regional_mode}")
+                
+                return final_platform, final_display_name
+        
             # STEP 4: No pattern matched
             if debug_mode:
-                self.logger.debug(f"    [X] No regex patterns matched (tested {patterns_tested} patterns)")
+                self.logger.debug(f"    [X] No regex patterns matched (tested {len(self._platform_entries)} patterns)")
             
             self.performance_monitor.record_cache_miss("platform_identification")
             return None
             
         finally:
             # Record total identification time
-            total_time = time.perf_counter() - start_time
-            self.performance_monitor.timing_data["_identify_platform"].append(total_time)
+            if start_time is not None:
+                self.performance_monitor.timing_data["_identify_platform"].append(time.perf_counter() - start_time)
+    
+    def identify_platforms_batch(self, folder_names: List[str], debug_mode: bool = False) -> List[Optional[Tuple[str, str]]]:
+        """Identify many folder names in one call; results are in input order
+        
+        All names share the combined PLATFORM_MAPPINGS matcher and the per-name
+        mapping cache, so repeated or preprocessed-equal names are matched once.
+        """
+        identify = self._identify_platform
+        return [identify(folder_name, debug_mode) for folder_name in folder_names]
+    
+    def _resolve_platform_mapping(self, folder_name: str) -> Optional[Tuple[int, str, str]]:
+        """Match PLATFORM_MAPPINGS and apply regional preferences, without logging or metrics"""
+        platform_match = self._platform_matcher.match(folder_name)
+        if not platform_match:
+            return None
+        pattern_index = int(platform_match.lastgroup[1:])
+        shortcode = self._platform_entries[pattern_index][1][0]
+        final_platform = self.regional_engine.get_target_platform(folder_name, shortcode)
+        return pattern_index, final_platform, self.regional_engine.get_display_name(final_platform)
 
 class FormatHandler:
     """Handles special format requirements (like N64 variants and NDS encryption states)"""
@@ -2723,54 +3591,59 @@ class InteractiveSelector:
     def show_analysis_summary(self, platforms: Dict[str, PlatformInfo], 
                             excluded: Dict[str, Tuple[str, int]], unknown: List[str], unknown_files: int = 0) -> None:
         """Display comprehensive analysis summary"""
-        print("\n" + "="*80)
-        print("ROM COLLECTION ANALYSIS")
-        print("="*80)
-        print(f"🌐 Regional Mode: {self.regional_engine.regional_mode.upper()}")
+        # Collected and written in one go instead of one print() per line
+        out = [
+            "\n" + "="*80,
+            "ROM COLLECTION ANALYSIS",
+            "="*80,
+            f"🌐 Regional Mode: {self.regional_engine.regional_mode.upper()}",
+        ]
         
         if self.regional_engine.regional_mode == "consolidated":
-            print("📁 Regional variants will be merged (NES+Famicom->nes)")
+            out.append("📁 Regional variants will be merged (NES+Famicom->nes)")
         else:
-            print("📁 Regional variants will be kept separate (NES->nes, Famicom->famicom)")
+            out.append("📁 Regional variants will be kept separate (NES->nes, Famicom->famicom)")
         
-        print("⚠️  Significant variants always separated (FDS, N64DD, Sega CD)")
-        print("="*80)
+        out.append("⚠️  Significant variants always separated (FDS, N64DD, Sega CD)")
+        out.append("="*80)
         
         if platforms:
             total_supported_files = sum(info.file_count for info in platforms.values())
-            print(f"\n✅ SUPPORTED PLATFORMS FOUND ({len(platforms)}):")
-            print("-" * 50)
-            print(f"     🎮 Total supported files: {total_supported_files:,}")
-            print()
+            out.append(f"\n✅ SUPPORTED PLATFORMS FOUND ({len(platforms)}):")
+            out.append("-" * 50)
+            out.append(f"     🎮 Total supported files: {total_supported_files:,}")
+            out.append("")
             for i, (shortcode, info) in enumerate(sorted(platforms.items()), 1):
-                print(f"[{i:2d}] {shortcode:<12} - {info.display_name}")
-                print(f"     📁 {info.folder_count} folders, 🎮 {info.file_count:,} files")
+                out.append(f"[{i:2d}] {shortcode:<12} - {info.display_name}")
+                out.append(f"     📁 {info.folder_count} folders, 🎮 {info.file_count:,} files")
         
         if excluded:
-            print(f"\n⚠️  EXCLUDED PLATFORMS ({len(excluded)}):")
-            print("-" * 50)
+            out.append(f"\n⚠️  EXCLUDED PLATFORMS ({len(excluded)}):")
+            out.append("-" * 50)
             total_excluded_files = sum(file_count for reason, file_count in excluded.values())
-            print(f"     🎮 Total excluded files: {total_excluded_files:,}")
-            print()
+            out.append(f"     🎮 Total excluded files: {total_excluded_files:,}")
+            out.append("")
             items_shown = list(excluded.items())[:10]  # Show first 10
             for folder_name, (reason, file_count) in items_shown:
-                print(f"    • {folder_name} - {reason}")
+                out.append(f"    • {folder_name} - {reason}")
                 if file_count > 0:
-                    print(f"      🎮 {file_count:,} files")
+                    out.append(f"      🎮 {file_count:,} files")
             if len(excluded) > 10:
-                print(f"    ... and {len(excluded) - 10} more")
+                out.append(f"    ... and {len(excluded) - 10} more")
         
         if unknown:
-            print(f"\n❓ UNKNOWN PLATFORMS ({len(unknown)}):")
-            print("-" * 50)
-            print(f"     🎮 Total unknown files: {unknown_files:,}")
-            print()
+            out.append(f"\n❓ UNKNOWN PLATFORMS ({len(unknown)}):")
+            out.append("-" * 50)
+            out.append(f"     🎮 Total unknown files: {unknown_files:,}")
+            out.append("")
             for item in unknown[:10]:  # Show first 10
-                print(f"    • {item}")
+                out.append(f"    • {item}")
             if len(unknown) > 10:
-                print(f"    ... and {len(unknown) - 10} more")
+                out.append(f"    ... and {len(unknown) - 10} more")
         
-        print("\n" + "="*80)
+        out.append("\n" + "="*80)
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
     
     def get_platform_selection(self, platforms: Dict[str, PlatformInfo]) -> List[str]:
         """Get user's platform selection"""
@@ -2778,6 +3651,9 @@ class InteractiveSelector:
             print("No supported platforms found!")
             return []
         
+        # Same order as the numbered list in show_analysis_summary; built once for all retries
+        platform_list = sorted(platforms)
+        
         while True:
             print("\nSelect platforms to process:")
             print("• Enter platform numbers (e.g., 1,3,5-8)")
@@ -2792,7 +3668,7 @@ class InteractiveSelector:
                 elif user_input == 'all':
                     return list(platforms.keys())
                 else:
-                    return self._parse_selection(user_input, platforms)
+                    return self._parse_selection(user_input, platform_list)
                     
             except KeyboardInterrupt:
                 print("\nOperation cancelled.")
@@ -2800,24 +3676,16 @@ class InteractiveSelector:
             except Exception as e:
                 print(f"Invalid input: {e}. Please try again.")
     
-    def _parse_selection(self, selection: str, platforms: Dict[str, PlatformInfo]) -> List[str]:
-        """Parse user selection string into platform list"""
-        platform_list = list(sorted(platforms.keys()))
+    def _parse_selection(self, selection: str, platform_list: List[str]) -> List[str]:
+        """Parse user selection string into platform list (platform_list: sorted shortcodes)"""
         selected = set()
         
         for part in selection.split(','):
-            part = part.strip()
-            if '-' in part:
-                # Range selection
-                start, end = map(int, part.split('-'))
-                for i in range(start - 1, end):
-                    if 0 <= i < len(platform_list):
-                        selected.add(platform_list[i])
-            else:
-                # Single selection
-                index = int(part) - 1
-                if 0 <= index < len(platform_list):
-                    selected.add(platform_list[index])
+            start, is_range, end = part.partition('-')
+            start = int(start)
+            # 1-based inclusive selection -> slice; slicing clips out-of-range indices for us
+            end = int(end) if is_range else start
+            selected.update(platform_list[max(start - 1, 0):max(end, 0)])
         
         if not selected:
             raise ValueError("No valid platforms selected")
@@ -2878,7 +3746,7 @@ class ComprehensiveLogger:
             
             # Use SafeFileHandler for sanitized output (no rotation for simplicity)
             # Could extend SafeFileHandler to support rotation if needed
-            fh = SafeFileHandler(config['file'], encoding='utf-8')
+            fh = SafeFileHandler(config['file'], encoding='utf-8', flush_each_record=False)
             fh.setLevel(config['level'])
             
             # All logging goes to files only - console controlled by ModernTerminalDisplay
@@ -2890,7 +3758,13 @@ class ComprehensiveLogger:
             )
             fh.setFormatter(formatter)
             
-            logger.addHandler(fh)
+            # Buffer records in memory so the file sees one write+flush per batch, not per record,
+            # and feed the buffer from a queue so logging threads never wait on file I/O
+            bh = BufferedLogHandler(fh)
+            bh.setLevel(config['level'])
+            qh = QueuedLogHandler(bh)
+            qh.setLevel(config['level'])
+            logger.addHandler(qh)
             self.loggers[log_type] = logger
             
             # Write enhanced header with context to each log file
@@ -2918,6 +3792,7 @@ Description: {description}
         
         # Write header directly to log (without timestamp prefix)
         for handler in logger.handlers:
+            handler = log_file_handler(handler)
             if isinstance(handler, (logging.FileHandler, SafeFileHandler)):
                 # Write raw header without formatter
                 handler.stream.write(header + '\n')
@@ -2947,6 +3822,53 @@ def check_version_consistency(logger=None):
         # Non-critical - don't block execution if version check fails
         pass
 
+# Fixed parts of the end-of-run summary, rendered with str.format_map; the conditional
+# sections in between are appended by EnhancedROMOrganizer._generate_comprehensive_summary
+_SUMMARY_TEMPLATE = """\
+================================================================================
+🎮 ENHANCED ROM ORGANIZER - PROCESSING SUMMARY 🎮
+================================================================================
+📅 Timestamp: {timestamp}
+⏱️ Processing Time: {processing_time:.2f} seconds
+🔧 Mode: {mode}
+
+📊 PROCESSING STATISTICS:
+  🎯 Platforms Found: {platforms_found}
+  ✅ Platforms Selected: {platforms_selected}
+
+🔍 FILE DISCOVERY (Comprehensive):
+  📁 Total Files Discovered: {files_discovered}
+  🎮 ROM Files (Processed): {files_found:,}
+  📄 Non-ROM Files (Skipped): {non_rom_files}
+
+✨ PROCESSING RESULTS:
+  📥 Files Copied (New): {files_copied:,}
+  🔄 Files Renamed (Duplicates): {files_renamed:,}
+  ♻️  Files Replaced: {files_replaced:,}
+  ⏭️  Files Skipped (Identical): {files_skipped:,}
+  ❓ Files Skipped (Unknown): {files_skipped_unknown:,}
+  🎯 Total Unique Files: {total_unique:,}
+  📂 Folders Created: {folders_created}
+  ❌ Errors: {errors:,}"""
+
+_SUMMARY_FOOTER_TEMPLATE = """
+📄 LOGS GENERATED:
+  📝 [LOG] Operations: logs/operations_{timestamp}.log
+  📈 [STATS] Analysis: logs/analysis_{timestamp}.log
+  🚨 [ERRORS] Errors: logs/errors_{timestamp}.log
+  📊 [PROGRESS] Progress: logs/progress_{timestamp}.log
+  📋 [LOG] Summary: logs/summary_{timestamp}.log
+  🧾 [JSON] Summary data: logs/summary_{timestamp}.json
+  ⚡ [PERF] Performance: logs/performance_{timestamp}.log
+
+🔧 PERFORMANCE OPTIMIZATIONS:
+  🧵 [THREAD] Concurrent I/O workers: {max_workers}
+  💾 [MEM] Memory-mapped hash calculation for large files (>={mmap_threshold_mb}MB)
+  🔄 [CYCLE] Chunked hashing through a reused {read_buffer_mb}MB read buffer
+  📊 [STATS] Thread-safe progress tracking with live updates
+
+================================================================================"""
+
 class EnhancedROMOrganizer:
     """Main ROM organizer with enhanced features"""
     
@@ -2966,6 +3888,9 @@ class EnhancedROMOrganizer:
         
         # Initialize components
         self.comprehensive_logger = ComprehensiveLogger(dry_run, debug)
+        open_hash_cache(Path("logs") / "hash_cache.sqlite",
+                        rebuild=getattr(args, 'rebuild_hash_cache', False) if args else False,
+                        logger=self.comprehensive_logger.get_logger('errors'))
         
         # Run version consistency check (non-blocking)
         check_version_consistency(self.comprehensive_logger.get_logger('operations'))
@@ -2995,8 +3920,14 @@ class EnhancedROMOrganizer:
             self.comprehensive_logger.get_logger('errors'),
             self.comprehensive_logger.get_logger('progress'),
             dry_run,
-            shutdown_handler
+            shutdown_handler,
+            processes=getattr(args, 'processes', None) if args else None,
+            paranoid_hash=getattr(args, 'paranoid_hash', False) if args else False,
+            skip_identical=self.skip_identical,
+            pin_threads=getattr(args, 'pin_threads', False) if args else False
         )
+        if self.max_workers:
+            self.async_copy_engine.max_workers = self.max_workers
         
         
         # Statistics tracking
@@ -3057,23 +3988,26 @@ class EnhancedROMOrganizer:
             self.logger_ops.debug(f"Environment DEBUG - Could not detect environment: {str(e)}")
     
     def _group_files_by_folder(self, all_files: List[Path], platforms: Dict) -> Dict:
-        """Group files by their parent folder for adaptive processing"""
+        """Group files by their parent folder for adaptive processing
+        
+        Discovered files live under source_dir/<source folder>, so the platform is
+        looked up once per parent directory from that top-level folder name.
+        """
+        folder_to_platform = {}
+        for shortcode, platform_info in platforms.items():
+            for source_folder in platform_info.source_folders:
+                folder_to_platform.setdefault(source_folder, shortcode)
+        
         files_by_folder = defaultdict(list)
+        parent_platforms = {}
         
-        # Group files by parent directory and identify platforms
         for file_path in all_files:
-            # Find which platform this file belongs to
-            platform_shortcode = None
-            for shortcode, platform_info in platforms.items():
-                for source_folder in platform_info.source_folders:
-                    if str(source_folder) in str(file_path.parent):
-                        platform_shortcode = shortcode
-                        break
-                if platform_shortcode:
-                    break
+            folder_key = str(file_path.parent)
+            if folder_key not in parent_platforms:
+                parent_platforms[folder_key] = self._platform_for_parent(file_path.parent, folder_to_platform, platforms)
+            platform_shortcode = parent_platforms[folder_key]
             
             if platform_shortcode:
-                folder_key = str(file_path.parent)
                 files_by_folder[folder_key].append({
                     'path': file_path,
                     'platform': platform_shortcode
@@ -3082,9 +4016,26 @@ class EnhancedROMOrganizer:
         self.logger_ops.debug(f"WSL2 DEBUG - Grouped {len(all_files)} files into {len(files_by_folder)} folders")
         return files_by_folder
     
+    def _platform_for_parent(self, parent: Path, folder_to_platform: Dict[str, str], platforms: Dict) -> Optional[str]:
+        """Platform of a directory below source_dir, by its top-level source folder"""
+        try:
+            platform_shortcode = folder_to_platform.get(parent.relative_to(self.source_dir).parts[0])
+        except (ValueError, IndexError):
+            platform_shortcode = None
+        if platform_shortcode:
+            return platform_shortcode
+        
+        # Not under a known source folder: fall back to a substring match on the path
+        parent_str = str(parent)
+        for shortcode, platform_info in platforms.items():
+            for source_folder in platform_info.source_folders:
+                if str(source_folder) in parent_str:
+                    return shortcode
+        return None
+    
     def organize_roms(self) -> ProcessingStats:
         """Main organization workflow"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             # Initialize modern terminal display
@@ -3179,13 +4130,12 @@ class EnhancedROMOrganizer:
                         extensions_found = set()
                         
                         try:
-                            for root, dirs, files in os.walk(unknown_dir_path):
-                                for file in files:
-                                    all_files.append(file)
-                                    extension = Path(file).suffix.lower()
-                                    extensions_found.add(extension)
-                                    if extension in ROM_EXTENSIONS:
-                                        folder_rom_files.append(file)
+                            for file in iter_file_names(unknown_dir_path):
+                                all_files.append(file)
+                                extension = file_extension(file)
+                                extensions_found.add(extension)
+                                if extension in ROM_EXTENSIONS:
+                                    folder_rom_files.append(file)
                         except Exception as e:
                             self.analyzer.logger.error(f"    Error walking directory: {e}")
                             continue
@@ -3296,8 +4246,7 @@ class EnhancedROMOrganizer:
             self._process_selected_platforms(platforms, selected_platforms)
             
             # Phase 4: Generate Summary
-            end_time = datetime.now()
-            self.stats.processing_time = (end_time - start_time).total_seconds()
+            self.stats.processing_time = time.perf_counter() - start_time
             
             # Update display with final statistics
             progress_display.stats['processing_time'] = self.stats.processing_time
@@ -3324,56 +4273,63 @@ class EnhancedROMOrganizer:
         analysis_logger = self.comprehensive_logger.get_logger('analysis')
         
         analysis_logger.info("=== PLATFORM ANALYSIS RESULTS ===")
-        analysis_logger.info(f"Supported platforms found: {len(platforms)}")
-        analysis_logger.info(f"Excluded platforms: {len(excluded)}")
-        analysis_logger.info(f"Unknown platforms: {len(unknown)}")
+        analysis_logger.info("Supported platforms found: %d", len(platforms))
+        analysis_logger.info("Excluded platforms: %d", len(excluded))
+        analysis_logger.info("Unknown platforms: %d", len(unknown))
         
         for shortcode, info in platforms.items():
-            analysis_logger.info(f"Platform: {shortcode} ({info.display_name})")
-            analysis_logger.info(f"  Folders: {info.folder_count}, Files: {info.file_count}")
+            analysis_logger.info("Platform: %s (%s)", shortcode, info.display_name)
+            analysis_logger.info("  Folders: %d, Files: %d", info.folder_count, info.file_count)
             for folder in info.source_folders:
-                analysis_logger.info(f"  Source: {folder}")
+                analysis_logger.info("  Source: %s", folder)
         
         if excluded:
             analysis_logger.info("\nEXCLUDED PLATFORMS:")
             for item in excluded:
-                analysis_logger.info(f"  {item}")
+                analysis_logger.info("  %s", item)
         
         if unknown:
             analysis_logger.info("\nUNKNOWN PLATFORMS:")
             for item in unknown:
-                analysis_logger.info(f"  {item}")
+                analysis_logger.info("  %s", item)
     
     def _process_selected_platforms(self, platforms: Dict[str, PlatformInfo], 
                                   selected_platforms: List[str]) -> None:
         """Process files for selected platforms using concurrent optimization"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        # Selections are always drawn from the analyzed platforms (all keys, or the interactive picks)
+        assert set(selected_platforms) <= platforms.keys(), "selected platforms must come from analysis"
         
         # Update display stats for processing phase
-        total_expected_files = sum(platforms[p].file_count for p in selected_platforms if p in platforms)
+        total_expected_files = sum(platforms[p].file_count for p in selected_platforms)
         
         # Log performance configuration
-        cpu_count = os.cpu_count() or 1
-        self.logger_performance.info(f"System CPU cores: {cpu_count}")
-        self.logger_performance.info(f"I/O worker threads: {self.async_copy_engine.max_workers}")
-        self.logger_performance.info(f"Hash chunk size: 8MB (default)")
+        self.logger_performance.info("System CPU cores: %d", _CPU_COUNT)
+        self.logger_performance.info("Hash read buffer: %dMB, mmap for files >= %dMB", READ_BUFFER_SIZE >> 20, MMAP_HASH_THRESHOLD >> 20)
         
         # Phase 1: Concurrent file discovery
-        discovery_start = datetime.now()
+        discovery_start = time.perf_counter()
         all_files = self.async_copy_engine.discover_files_concurrent(platforms, selected_platforms, self.source_dir)
-        discovery_time = (datetime.now() - discovery_start).total_seconds()
+        discovery_time = time.perf_counter() - discovery_start
         
         # Log discovery completion (no console output)
-        self.logger_performance.info(f"File discovery completed in {discovery_time:.2f} seconds")
-        self.logger_performance.info(f"Discovery rate: {len(all_files) / max(discovery_time, 0.1):.1f} files/second")
+        self.logger_performance.info("File discovery completed in %.2f seconds", discovery_time)
+        self.logger_performance.info("Discovery rate: %.1f files/second", len(all_files) / max(discovery_time, 0.1))
         
         if not all_files:
             print("ℹ️  No ROM files found to process!")
             self.logger_progress.info("No ROM files found to process!")
             return
         
+        # Size the copy pool to the workload unless --threads was given
+        if not self.max_workers:
+            self.async_copy_engine.max_workers = self.async_copy_engine.size_workers_to_files(all_files)
+            self.logger_performance.info("I/O worker threads: %d (sized from file sizes)", self.async_copy_engine.max_workers)
+        else:
+            self.logger_performance.info("I/O worker threads: %d (--threads)", self.async_copy_engine.max_workers)
+        
         # Phase 2: Adaptive file processing using AsyncFileCopyEngine
-        processing_start = datetime.now()
+        processing_start = time.perf_counter()
         
         # Convert file list to folder-grouped structure for adaptive processing
         files_by_folder = self._group_files_by_folder(all_files, platforms)
@@ -3389,11 +4345,11 @@ class EnhancedROMOrganizer:
             processed_count += 1
             
             # Add to activity log
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = time.strftime("%H:%M:%S")
             progress_display.add_activity(timestamp, file_desc, "copied", "")
             
             # Update live progress with ACTUAL processing totals
-            elapsed = (datetime.now() - processing_start).total_seconds()
+            elapsed = time.perf_counter() - processing_start
             rate = processed_count / max(elapsed, 0.1)
             eta = (total_files_to_process - processed_count) / max(rate, 0.1)
             
@@ -3414,7 +4370,12 @@ class EnhancedROMOrganizer:
         processing_stats = self.async_copy_engine.copy_files_adaptive(
             files_by_folder, platforms, self.target_dir, progress_callback
         )
-        processing_time = (datetime.now() - processing_start).total_seconds()
+        if _hash_cache is not None:
+            _hash_cache.flush()
+        if _hash_cache is not None and (_hash_cache.hits or _hash_cache.misses):
+            self.logger_performance.info("Hash cache: %d hits, %d misses (%s)",
+                                         _hash_cache.hits, _hash_cache.misses, _hash_cache.db_path)
+        processing_time = time.perf_counter() - processing_start
         
         # Check if shutdown was requested during processing
         if shutdown_handler.check_shutdown():
@@ -3429,6 +4390,7 @@ class EnhancedROMOrganizer:
         self.stats.files_skipped_duplicate = processing_stats.files_skipped_duplicate
         self.stats.errors = processing_stats.errors
         self.stats.error_details = processing_stats.error_details
+        self.stats.folders_created = processing_stats.folders_created
         
         # Validate target file counts to detect discrepancies
         if not self.dry_run:
@@ -3438,11 +4400,11 @@ class EnhancedROMOrganizer:
             )
             
             if discrepancies:
-                self.logger_ops.warning(f"File count validation detected {len(discrepancies)} issues")
+                self.logger_ops.warning("File count validation detected %d issues", len(discrepancies))
                 for discrepancy in discrepancies:
-                    self.logger_ops.warning(f"VALIDATION: {discrepancy}")
+                    self.logger_ops.warning("VALIDATION: %s", discrepancy)
             else:
-                self.logger_ops.info(f"File count validation passed: {actual_count} files confirmed")
+                self.logger_ops.info("File count validation passed: %d files confirmed", actual_count)
         
         # Update display stats with processing results
         progress_display.stats.update({
@@ -3454,51 +4416,43 @@ class EnhancedROMOrganizer:
         })
         
         # Log performance metrics
-        total_time = (datetime.now() - start_time).total_seconds()
-        self.logger_performance.info(f"Processing completed in {processing_time:.2f} seconds")
-        self.logger_performance.info(f"Total processing time: {total_time:.2f} seconds")
+        total_time = time.perf_counter() - start_time
+        self.logger_performance.info("Processing completed in %.2f seconds", processing_time)
+        self.logger_performance.info("Total processing time: %.2f seconds", total_time)
         if processing_stats.files_copied > 0:
-            self.logger_performance.info(f"Copy rate: {processing_stats.files_copied / max(processing_time, 0.1):.1f} files/second")
+            self.logger_performance.info("Copy rate: %.1f files/second", processing_stats.files_copied / max(processing_time, 0.1))
         
         # Final progress update
-        self.logger_progress.info(f"[OK] Processing complete!")
+        self.logger_progress.info("[OK] Processing complete!")
         self.logger_progress.info(f"[STATS] Files copied: {processing_stats.files_copied:,}")
         self.logger_progress.info(f"[STATS] Files renamed (duplicates): {processing_stats.files_renamed_duplicates:,}")
         self.logger_progress.info(f"[STATS] Files replaced: {processing_stats.files_replaced:,}")
         self.logger_progress.info(f"[STATS] Files skipped (duplicates): {processing_stats.files_skipped_duplicate:,}")
         self.logger_progress.info(f"[STATS] Total unique files: {processing_stats.total_unique_files:,}")
         self.logger_progress.info(f"[STATS] Errors: {processing_stats.errors:,}")
-        self.logger_progress.info(f"[TIME] Total time: {total_time:.2f} seconds")
+        self.logger_progress.info("[TIME] Total time: %.2f seconds", total_time)
     
     def _generate_comprehensive_summary(self) -> None:
         """Generate comprehensive processing summary"""
-        summary_lines = [
-            "=" * 80,
-            "🎮 ENHANCED ROM ORGANIZER - PROCESSING SUMMARY 🎮",
-            "=" * 80,
-            f"📅 Timestamp: {datetime.now()}",
-            f"⏱️ Processing Time: {self.stats.processing_time:.2f} seconds",
-            f"🔧 Mode: {'DRY RUN' if self.dry_run else 'LIVE RUN'}",
-            "",
-            "📊 PROCESSING STATISTICS:",
-            f"  🎯 Platforms Found: {self.stats.platforms_found}",
-            f"  ✅ Platforms Selected: {len(self.stats.selected_platforms)}",
-            "",
-            "🔍 FILE DISCOVERY (Comprehensive):",
-            f"  📁 Total Files Discovered: {getattr(self.async_copy_engine, 'total_files_discovered', 'N/A'):,}",
-            f"  🎮 ROM Files (Processed): {self.stats.files_found:,}",
-            f"  📄 Non-ROM Files (Skipped): {getattr(self.async_copy_engine, 'total_files_discovered', self.stats.files_found) - self.stats.files_found:,}" if hasattr(self.async_copy_engine, 'total_files_discovered') else "  📄 Non-ROM Files (Skipped): N/A",
-            "",
-            "✨ PROCESSING RESULTS:",
-            f"  📥 Files Copied (New): {self.stats.files_copied:,}",
-            f"  🔄 Files Renamed (Duplicates): {self.stats.files_renamed_duplicates:,}",
-            f"  ♻️  Files Replaced: {self.stats.files_replaced:,}",
-            f"  ⏭️  Files Skipped (Identical): {self.stats.files_skipped_duplicate:,}",
-            f"  ❓ Files Skipped (Unknown): {self.stats.files_skipped_unknown:,}",
-            f"  🎯 Total Unique Files: {self.stats.total_unique_files:,}",
-            f"  📂 Folders Created: {len(self.stats.folders_created) if hasattr(self.stats, 'folders_created') else 'N/A'}",
-            f"  ❌ Errors: {self.stats.errors:,}",
-        ]
+        discovered = getattr(self.async_copy_engine, 'total_files_discovered', None)
+        summary_lines = [_SUMMARY_TEMPLATE.format_map({
+            'timestamp': datetime.now(),
+            'processing_time': self.stats.processing_time,
+            'mode': 'DRY RUN' if self.dry_run else 'LIVE RUN',
+            'platforms_found': self.stats.platforms_found,
+            'platforms_selected': len(self.stats.selected_platforms),
+            'files_discovered': f"{discovered:,}" if discovered is not None else 'N/A',
+            'files_found': self.stats.files_found,
+            'non_rom_files': f"{discovered - self.stats.files_found:,}" if discovered is not None else 'N/A',
+            'files_copied': self.stats.files_copied,
+            'files_renamed': self.stats.files_renamed_duplicates,
+            'files_replaced': self.stats.files_replaced,
+            'files_skipped': self.stats.files_skipped_duplicate,
+            'files_skipped_unknown': self.stats.files_skipped_unknown,
+            'total_unique': self.stats.total_unique_files,
+            'folders_created': len(self.stats.folders_created) if hasattr(self.stats, 'folders_created') else 'N/A',
+            'errors': self.stats.errors,
+        })]
         
         # Add error categorization breakdown if errors occurred
         if self.stats.errors > 0 and self.stats.error_details:
@@ -3564,30 +4518,51 @@ class EnhancedROMOrganizer:
                 f"  📊 Average File Size: Calculated during processing"
             ])
         
-        summary_lines.extend([
-            "",
-            "📄 LOGS GENERATED:",
-            f"  📝 [LOG] Operations: logs/operations_{self.comprehensive_logger.timestamp}.log",
-            f"  📈 [STATS] Analysis: logs/analysis_{self.comprehensive_logger.timestamp}.log", 
-            f"  🚨 [ERRORS] Errors: logs/errors_{self.comprehensive_logger.timestamp}.log",
-            f"  📊 [PROGRESS] Progress: logs/progress_{self.comprehensive_logger.timestamp}.log",
-            f"  📋 [LOG] Summary: logs/summary_{self.comprehensive_logger.timestamp}.log",
-            f"  ⚡ [PERF] Performance: logs/performance_{self.comprehensive_logger.timestamp}.log",
-            "",
-            "🔧 PERFORMANCE OPTIMIZATIONS:",
-            f"  🧵 [THREAD] Concurrent I/O workers: {self.async_copy_engine.max_workers}",
-            f"  💾 [MEM] Memory-mapped hash calculation for large files (>10MB)",
-            f"  🔄 [CYCLE] Chunked processing with 8MB chunks",
-            f"  📊 [STATS] Thread-safe progress tracking with live updates",
-            "",
-            "=" * 80
-        ])
+        summary_lines.append(_SUMMARY_FOOTER_TEMPLATE.format_map({
+            'timestamp': self.comprehensive_logger.timestamp,
+            'max_workers': self.async_copy_engine.max_workers,
+            'mmap_threshold_mb': MMAP_HASH_THRESHOLD >> 20,
+            'read_buffer_mb': READ_BUFFER_SIZE >> 20,
+        }))
         
         summary_text = "\n".join(summary_lines)
         
-        # Log to summary file and display
+        # Log to summary file and display (writelines avoids copying the text into a "\n" + ... string)
         self.logger_summary.info(summary_text)
-        print("\n" + summary_text)
+        sys.stdout.writelines(("\n", summary_text, "\n"))
+        self._write_summary_json(discovered)
+    
+    def _write_summary_json(self, files_discovered: Optional[int]) -> None:
+        """Write the summary counters to logs/summary_<timestamp>.json for scripts and CI"""
+        summary_file = Path("logs") / f"summary_{self.comprehensive_logger.timestamp}.json"
+        try:
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': __version__,
+                    'timestamp': datetime.now().isoformat(),
+                    'mode': 'dry_run' if self.dry_run else 'live',
+                    'source_dir': str(self.source_dir),
+                    'target_dir': str(self.target_dir),
+                    'processing_time': self.stats.processing_time,
+                    'platforms_found': self.stats.platforms_found,
+                    'selected_platforms': sorted(self.stats.selected_platforms),
+                    'files_discovered': files_discovered,
+                    'files_found': self.stats.files_found,
+                    'files_copied': self.stats.files_copied,
+                    'files_renamed': self.stats.files_renamed_duplicates,
+                    'files_replaced': self.stats.files_replaced,
+                    'files_skipped': self.stats.files_skipped_duplicate,
+                    'files_skipped_unknown': self.stats.files_skipped_unknown,
+                    'total_unique': self.stats.total_unique_files,
+                    'folders_created': len(self.stats.folders_created),
+                    'errors': self.stats.errors,
+                    'error_categories': dict(Counter(error['category'] for error in self.stats.error_details)),
+                    'io_workers': self.async_copy_engine.max_workers,
+                    'mmap_threshold_mb': MMAP_HASH_THRESHOLD >> 20,
+                    'read_buffer_mb': READ_BUFFER_SIZE >> 20,
+                }, f, indent=2)
+        except OSError as e:
+            self.logger_ops.warning("Could not write summary data to %s: %s", summary_file, e)
 
 def main():
     """Main application entry point"""
@@ -3654,8 +4629,18 @@ Features:
     # New concurrency and verification options
     parser.add_argument("--threads", type=int, choices=range(1, 9), metavar="[1-8]",
                        help="Number of concurrent threads (1-8). Default: 2 on Windows, 4 on Linux")
+    parser.add_argument("--processes", type=int, metavar="N",
+                       help="Copy with N worker processes, one platform per task (default: threads only)")
     parser.add_argument("--verify-copies", action="store_true",
                        help="Verify copied files with SHA1 hash after copying (adds overhead)")
+    parser.add_argument("--pin-threads", action="store_true",
+                       help="Pin copy worker threads to CPUs round-robin (Linux; ignored with --processes)")
+    parser.add_argument("--paranoid-hash", action="store_true",
+                       help="Never compare a name collision against a pre-run target's cached digest "
+                            "via the size/mtime shortcut; look up both SHA1s the regular way (unchanged "
+                            "files are still answered from the hash cache unless --rebuild-hash-cache)")
+    parser.add_argument("--rebuild-hash-cache", action="store_true",
+                       help="Discard cached SHA1 hashes (logs/hash_cache.sqlite) and rehash every compared file")
     parser.add_argument("--skip-identical", action="store_true", default=True,
                        help="Skip files with identical SHA1 hashes (default: enabled)")
     parser.add_argument("--no-skip-identical", action="store_false", dest="skip_identical",
@@ -3751,13 +4736,12 @@ Features:
                         extensions_found = set()
                         
                         try:
-                            for root, dirs, files in os.walk(unknown_dir_path):
-                                for file in files:
-                                    all_files.append(file)
-                                    extension = Path(file).suffix.lower()
-                                    extensions_found.add(extension)
-                                    if extension in ROM_EXTENSIONS:
-                                        folder_rom_files.append(file)
+                            for file in iter_file_names(unknown_dir_path):
+                                all_files.append(file)
+                                extension = file_extension(file)
+                                extensions_found.add(extension)
+                                if extension in ROM_EXTENSIONS:
+                                    folder_rom_files.append(file)
                         except Exception as e:
                             organizer.analyzer.logger.error(f"    Error walking directory: {e}")
                             continue
@@ -3966,9 +4950,9 @@ def test_regional_preferences():
     
     for test_name, test_cases_list in test_cases["consolidated_mode"].items():
         print(f"\n--- {test_name.replace('_', ' ').title()} ---")
-        for folder_name, expected_platform in test_cases_list:
+        results = consolidated_analyzer.identify_platforms_batch([folder_name for folder_name, _ in test_cases_list])
+        for (folder_name, expected_platform), result in zip(test_cases_list, results):
             total_tests += 1
-            result = consolidated_analyzer._identify_platform(folder_name)
             actual_platform = result[0] if result else None
             
             if actual_platform == expected_platform:
@@ -3987,9 +4971,9 @@ def test_regional_preferences():
     
     for test_name, test_cases_list in test_cases["regional_mode"].items():
         print(f"\n--- {test_name.replace('_', ' ').title()} ---")
-        for folder_name, expected_platform in test_cases_list:
+        results = regional_analyzer.identify_platforms_batch([folder_name for folder_name, _ in test_cases_list])
+        for (folder_name, expected_platform), result in zip(test_cases_list, results):
             total_tests += 1
-            result = regional_analyzer._identify_platform(folder_name)
             actual_platform = result[0] if result else None
             
             if actual_platform == expected_platform:
@@ -51,6 +51,9 @@ class GoodPatternHandler:
         'INTV': ('intellivision', 'Mattel Intellivision'),
     }
     
+    # Good tool naming: Good[Platform] [version/date info]
+    GOOD_PATTERN = re.compile(r'^Good([A-Z0-9]+)\b.*', re.IGNORECASE)
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(self.__class__.__name__)
     
@@ -59,8 +62,7 @@ class GoodPatternHandler:
         Match Good tool patterns like 'GoodNES v3.27' or 'GoodN64 (2022-01-15)'
         Returns (shortcode, display_name) tuple if matched
         """
-        # Pattern for Good tool naming: Good[Platform] [version/date info]
-        good_match = re.match(r'^Good([A-Z0-9]+)\b.*', folder_name, re.IGNORECASE)
+        good_match = self.GOOD_PATTERN.match(folder_name)
         
         if good_match:
             platform_code = good_match.group(1).upper()
@@ -95,6 +97,9 @@ class MAMEPatternHandler:
         'Arcade Games': ('arcade', 'Arcade'),
     }
     
+    FINALBURN_PATTERN = re.compile(r'^FinalBurn Neo - (.+)$', re.IGNORECASE)
+    MAME_PATTERN = re.compile(r'^MAME.*', re.IGNORECASE)
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(self.__class__.__name__)
     
@@ -103,7 +108,7 @@ class MAMEPatternHandler:
         Match FinalBurn Neo patterns like 'FinalBurn Neo - NES Games'
         Returns (shortcode, display_name) tuple if matched
         """
-        fb_match = re.match(r'^FinalBurn Neo - (.+)$', folder_name, re.IGNORECASE)
+        fb_match = self.FINALBURN_PATTERN.match(folder_name)
         
         if fb_match:
             platform_desc = fb_match.group(1)
@@ -124,7 +129,7 @@ class MAMEPatternHandler:
         Match MAME patterns - typically all arcade content
         Returns (shortcode, display_name) tuple if matched
         """
-        if re.match(r'^MAME.*', folder_name, re.IGNORECASE):
+        if self.MAME_PATTERN.match(folder_name):
             self.logger.debug(f"MAME pattern matched: '{folder_name}' -> arcade")
             return ("arcade", "Arcade (MAME)")
         
@@ -41,7 +41,7 @@ class SubcategoryConsolidationHandler(ProcessingHandler):
         self.logger = logger or logging.getLogger(__name__)
         
         # Subcategory patterns to strip (ordered by specificity)
-        self.subcategory_patterns = [
+        self.subcategory_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in [
             # Multi-level subcategories (most specific first)
             r"^(.+?)\s+-\s+\w+\s+-\s+(Games|Applications|Firmware|Educational|Various)\s+-\s+\[.+?\]\s*.*$",
             r"^(.+?)\s+-\s+\w+\s+-\s+(Games|Applications|Firmware|Educational|Various)\s*.*$",
@@ -49,21 +49,21 @@ class SubcategoryConsolidationHandler(ProcessingHandler):
             r"^(.+?)\s+-\s+(Games|Applications|Firmware|Educational|Compilations|Coverdisks|Samplers|Operating Systems|Demos|Various)\s+-\s+\[.+?\]\s*.*$",
             # Standard subcategories
             r"^(.+?)\s+-\s+(Games|Applications|Firmware|Educational|Compilations|Coverdisks|Samplers|Operating Systems|Demos|Various)\s*.*$",
-        ]
+        ]]
     
     def handle(self, folder_name: str, context: Dict) -> str:
         """Consolidate subcategory patterns"""
         original_name = folder_name
         
         for pattern in self.subcategory_patterns:
-            match = re.match(pattern, folder_name, re.IGNORECASE)
+            match = pattern.match(folder_name)
             if match:
                 # Extract the base platform name
                 base_platform = match.group(1).strip()
                 
                 # Log the consolidation decision
                 if self.logger:
-                    self.logger.debug(f"Subcategory consolidation: '{original_name}' -> '{base_platform}'")
+                    self.logger.debug("Subcategory consolidation: '%s' -> '%s'", original_name, base_platform)
                 
                 # Update context for downstream handlers
                 context['subcategory_consolidated'] = True
@@ -84,21 +84,21 @@ class FormatIndicatorHandler(ProcessingHandler):
         self.logger = logger or logging.getLogger(__name__)
         
         # Format indicator patterns to remove
-        self.format_patterns = [
+        self.format_patterns = [re.compile(pattern) for pattern in [
             r"\s*-\s*\[.+?\]\s*",  # Remove " - [FORMAT]" patterns
             r"\s*\[.+?\]\s*",      # Remove "[FORMAT]" patterns
             r"\s*\(.+?\)\s*$",     # Remove trailing "(Retool)", "(Parent-Clone)" etc.
-        ]
+        ]]
     
     def handle(self, folder_name: str, context: Dict) -> str:
         """Strip format indicators"""
         processed_name = folder_name
         
         for pattern in self.format_patterns:
-            new_name = re.sub(pattern, "", processed_name)
+            new_name = pattern.sub("", processed_name)
             if new_name != processed_name:
                 if self.logger:
-                    self.logger.debug(f"Format indicator removed: '{processed_name}' -> '{new_name.strip()}'")
+                    self.logger.debug("Format indicator removed: '%s' -> '%s'", processed_name, new_name.strip())
                 processed_name = new_name.strip()
                 
                 # Update context
@@ -117,7 +117,7 @@ class PublisherDisambiguationHandler(ProcessingHandler):
         # Publisher patterns to normalize (ordered by specificity)
         self.publisher_patterns = [
             # Microsoft MSX variants (most specific)
-            (r"^Microsoft\s+-\s+(MSX.*)$", r"\1"),
+            (re.compile(r"^Microsoft\s+-\s+(MSX.*)$", re.IGNORECASE), r"\1"),
             # Only strip publisher when it's clearly redundant
             # Keep "Nintendo - Game Boy" as is, only strip when subcategory follows
         ]
@@ -127,10 +127,10 @@ class PublisherDisambiguationHandler(ProcessingHandler):
         processed_name = folder_name
         
         for pattern, replacement in self.publisher_patterns:
-            new_name = re.sub(pattern, replacement, processed_name, flags=re.IGNORECASE)
+            new_name = pattern.sub(replacement, processed_name)
             if new_name != processed_name:
                 if self.logger:
-                    self.logger.debug(f"Publisher normalized: '{processed_name}' -> '{new_name}'")
+                    self.logger.debug("Publisher normalized: '%s' -> '%s'", processed_name, new_name)
                 processed_name = new_name
                 
                 # Update context
@@ -143,6 +143,10 @@ class PublisherDisambiguationHandler(ProcessingHandler):
 class SubcategoryProcessor:
     """Main processor that orchestrates the subcategory consolidation chain"""
     
+    # Every handler pattern needs one of these to match: " - " (subcategory), "[" or "(" (format
+    # indicators) or a leading "Microsoft " (publisher). Names without any skip the chain entirely.
+    CHAIN_TRIGGER = re.compile(r"[\[(]|\s-|^Microsoft\s", re.IGNORECASE)
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         
@@ -172,8 +176,11 @@ class SubcategoryProcessor:
             'original_name': folder_name
         }
         
-        # Run through the processing chain
-        processed_name = self.subcategory_handler.handle(folder_name, context)
+        # Run through the processing chain (only if some handler could change the name)
+        if self.CHAIN_TRIGGER.search(folder_name):
+            processed_name = self.subcategory_handler.handle(folder_name, context)
+        else:
+            processed_name = folder_name
         
         # Update statistics
         self.stats['processed_count'] += 1